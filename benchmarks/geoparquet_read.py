@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""
+Compare ``GeoParquetSource.read()``, which reads with a single multithreaded
+pyarrow call, against computing the dask-geopandas graph as it used to.
+
+Usage::
+
+    python benchmarks/geoparquet_read.py [nrows] [nfiles]
+"""
+import sys
+import tempfile
+import timeit
+
+import dask_geopandas
+import geopandas
+import numpy
+import pandas
+
+from intake_geopandas import GeoParquetSource
+
+
+def make_dataset(path, nrows, nfiles):
+    rng = numpy.random.default_rng(0)
+    per_file = nrows // nfiles
+    for i in range(nfiles):
+        x, y = rng.uniform(-180, 180, per_file), rng.uniform(-90, 90, per_file)
+        gdf = geopandas.GeoDataFrame(
+            {
+                "id": numpy.arange(i * per_file, (i + 1) * per_file),
+                "value": rng.normal(size=per_file),
+                "label": pandas.Series(rng.integers(0, 100, per_file)).astype(str),
+            },
+            geometry=geopandas.points_from_xy(x, y),
+            crs="EPSG:4326",
+        )
+        gdf.to_parquet(f"{path}/part.{i}.parquet", row_group_size=100_000)
+
+
+def main(nrows=2_000_000, nfiles=4, repeat=5):
+    with tempfile.TemporaryDirectory() as path:
+        make_dataset(path, nrows, nfiles)
+
+        def direct():
+            return GeoParquetSource(path).read()
+
+        def dask_compute():
+            return dask_geopandas.read_parquet(path, split_row_groups=False).compute()
+
+        assert len(direct()) == len(dask_compute()) == nrows // nfiles * nfiles
+        for name, func in [("pyarrow read()", direct), ("dask compute()", dask_compute)]:
+            best = min(timeit.repeat(func, number=1, repeat=repeat))
+            print(f"{name:>16}: {best:.3f}s for {nrows} rows in {nfiles} files")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:3]])
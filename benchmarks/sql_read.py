@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Compare ``SpatiaLiteSource.read()``, which decodes the WKB column in one
+vectorized call, against ``geopandas.read_postgis``, which parses geometries
+row by row, on a generated local SQLite table of EWKB points and polygons.
+
+SpatiaLite queries usually return ``AsEWKB``/``AsBinary`` columns, so the
+table stores EWKB blobs directly and the benchmark runs without the
+SpatiaLite extension.
+
+Usage::
+
+    python benchmarks/sql_read.py [nrows]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import timeit
+import warnings
+
+import geopandas
+import numpy
+import shapely
+
+from intake_geopandas import SpatiaLiteSource
+
+
+def make_database(path, nrows):
+    rng = numpy.random.default_rng(0)
+    x, y = rng.uniform(-180, 180, nrows), rng.uniform(-90, 90, nrows)
+    geoms = shapely.points(x, y)
+    # Every other row a small polygon, so that parsing is not trivially short
+    geoms[::2] = shapely.buffer(geoms[::2], 0.01, quad_segs=2)
+    wkb = shapely.to_wkb(shapely.set_srid(geoms, 4326), include_srid=True)
+    con = sqlite3.connect(path)
+    con.execute("CREATE TABLE features (id INTEGER, value REAL, geom BLOB)")
+    con.executemany(
+        "INSERT INTO features VALUES (?, ?, ?)",
+        zip(range(nrows), rng.normal(size=nrows).tolist(), wkb.tolist()),
+    )
+    con.commit()
+    con.close()
+
+
+def main(nrows=1_000_000, repeat=3):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "features.db")
+        make_database(path, nrows)
+        sql = "SELECT * FROM features"
+
+        def vectorized():
+            with sqlite3.connect(path) as con:
+                return SpatiaLiteSource(con, sql_expr=sql).read()
+
+        def row_by_row():
+            with sqlite3.connect(path) as con, warnings.catch_warnings():
+                # No spatial_ref_sys table to look the SRID up in
+                warnings.simplefilter("ignore", UserWarning)
+                return geopandas.read_postgis(sql, con, geom_col="geom")
+
+        assert len(vectorized()) == len(row_by_row()) == nrows
+        for name, func in [("vectorized", vectorized), ("read_postgis", row_by_row)]:
+            best = min(timeit.repeat(func, number=1, repeat=repeat))
+            print(f"{name:>12}: {best:.3f}s for {nrows} rows")
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:2]])
@@ -1,9 +1,30 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import json
+import os
+import posixpath
+import shutil
+import tempfile
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from urllib.parse import unquote
 
 import fsspec
 import geopandas
-from intake.source.base import DataSource, Schema
+import numpy
+import pandas
+import shapely
+from intake.source.base import DataSource, PatternMixin, Schema
+from intake.source.utils import reverse_formats
+from pyproj import CRS
+from shapely.geometry import box
+from shapely.geometry.base import BaseGeometry
+from shapely.ops import unary_union
 
 from ._version import get_versions
 
@@ -49,6 +70,15 @@ class GeoPandasSource(DataSource, ABC):
         self._get_schema()
         return self._dataframe
 
+    def iter_chunks(self, chunksize=100_000):
+        """
+        Yield the data as frames of at most `chunksize` rows. Sources that can
+        stream override this, otherwise the whole dataset is read first.
+        """
+        df = self.read()
+        for start in range(0, len(df), chunksize):
+            yield df.iloc[start : start + chunksize]
+
     def to_dask(self):
         raise NotImplementedError()
 
@@ -56,7 +86,7 @@ class GeoPandasSource(DataSource, ABC):
         self._dataframe = None
 
 
-class GeoPandasFileSource(GeoPandasSource):
+class GeoPandasFileSource(PatternMixin, GeoPandasSource):
     name = "geopandasfile"
 
     def __init__(
@@ -67,6 +97,14 @@ class GeoPandasFileSource(GeoPandasSource):
         bbox=None,
         geopandas_kwargs=None,
         metadata=None,
+        path_as_pattern=True,
+        pattern_filter=None,
+        chunksize=None,
+        engine=None,
+        columns=None,
+        where=None,
+        ignore_geometry=False,
+        geometry=None,
     ):
         """
         A source for a file opened by geopandas. Specializations of this are provided
@@ -81,6 +119,10 @@ class GeoPandasFileSource(GeoPandasSource):
             opened. Some examples:
             - ``{{ CATALOG_DIR }}data/states.shp``
             - ``http://some.domain.com/data/states.geo.json``
+            A glob pattern or a list of paths matching several files gives one
+            partition per file, and `read()` concatenates them, e.g.
+            - ``{{ CATALOG_DIR }}data/daily/*.geojson``
+            - ``{{ CATALOG_DIR }}data/{region}/{year}/parcels.shp``
 
         use_fsspec: bool
             Whether to use fsspec to open `urlpath`. By default, `urlpath` is passed
@@ -98,162 +140,2784 @@ class GeoPandasFileSource(GeoPandasSource):
         bbox : tuple | GeoDataFrame or GeoSeries, default None
             Filter features by given bounding box, GeoSeries, or GeoDataFrame.
             CRS mis-matches are resolved if given a GeoSeries or GeoDataFrame.
+            For GeoParquet, a shapely geometry is also accepted. Files and row
+            groups are then pruned using their bounds before the features are
+            filtered exactly.
 
         geopandas_kwargs : dict
             Any further arguments to pass to geopandas's read_file function.
+
+        path_as_pattern : bool or str, optional
+            Whether to treat the path as a pattern (ie. ``data_{field}.shp``)
+            and create new categorical columns in the output corresponding to
+            pattern fields. If str, is treated as pattern to match on.
+            Default is True.
+
+        pattern_filter : str, optional
+            A pandas query expression over the pattern fields, e.g.
+            ``"year >= 2020"``, used to skip files before opening them. Field
+            values are strings, unless the pattern gives them a format spec,
+            e.g. ``{year:d}`` for integers.
+
+        chunksize : int, optional
+            Number of rows per partition. Each file is split into row ranges
+            using the feature count from its OGR layer metadata, and each
+            partition reads only its own rows. By default there is one
+            partition per file.
+
+        engine : {"fiona", "pyogrio", "pyogrio+arrow"}, optional
+            The library used to read files. ``"pyogrio+arrow"`` reads columnar
+            Arrow batches instead of building features one by one. By default,
+            the fastest installed engine is used.
+
+        columns : list of str, optional
+            Only read these attribute columns. The geometry is always read.
+
+        where : str, optional
+            An OGR SQL WHERE clause on attribute columns, e.g. ``"pop > 1000"``,
+            evaluated by the reader so that rejected features are never built.
+
+        ignore_geometry : bool
+            Only read the attribute columns, without decoding any geometry, and
+            return a plain pandas DataFrame.
+
+        geometry : {None, "bounds"}, optional
+            With ``"bounds"``, return a plain pandas DataFrame where the
+            geometry is replaced by float64 ``minx``, ``miny``, ``maxx`` and
+            ``maxy`` columns. The pyogrio engines read the envelopes directly
+            from OGR, without building any shapely geometry.
         """
+        _check_geometry(geometry, ignore_geometry)
+        self.path_as_pattern = path_as_pattern
         self.urlpath = urlpath
         self._use_fsspec = use_fsspec
         self.storage_options = storage_options or {}
         self._bbox = bbox
         self._geopandas_kwargs = geopandas_kwargs or {}
+        self._pattern_filter = pattern_filter
+        self._chunksize = chunksize
+        self._engine = _resolve_engine(engine)
+        self._columns = columns
+        self._where = where
+        self._ignore_geometry = ignore_geometry
+        self._geometry = geometry
         self._dataframe = None
+        self._files = None
+        self._partitions = None
+        self._layer_infos = None
+        self._pattern_values = None
 
         super().__init__(metadata=metadata)
 
-    def _open_dataset(self):
+    def _get_files(self):
         """
-        Open dataset using geopandas.
+        Expand `urlpath` into the list of files to read, one per partition.
         """
-        if self._use_fsspec:
-            with fsspec.open_files(self.urlpath, **self.storage_options) as f:
-                f = self._resolve_single_file(f) if len(f) > 1 else f[0]
-                self._dataframe = geopandas.read_file(
-                    f,
-                    bbox=self._bbox,
-                    **self._geopandas_kwargs,
+        if self._files is None:
+            if self._use_fsspec:
+                files = fsspec.open_files(self.urlpath, **self.storage_options)
+                files = self._filter_pattern(files, [f.path for f in files])
+                if len(files) == 0:
+                    raise FileNotFoundError(f"No files found matching {self.urlpath}")
+                self._files = self._resolve_files(files)
+            else:
+                files = _expand_urlpath(self.urlpath, self.storage_options)
+                self._files = self._select_paths(
+                    self._filter_pattern(
+                        files, [fsspec.core.strip_protocol(f) for f in files]
+                    )
                 )
-        else:
-            self._dataframe = geopandas.read_file(
-                self.urlpath, bbox=self._bbox, **self._geopandas_kwargs
-            )
+                if len(self._files) == 0:
+                    raise FileNotFoundError(f"No files found matching {self.urlpath}")
+        return self._files
 
-    def _resolve_single_file(self, filelist):
+    def _filter_pattern(self, files, paths):
         """
-        Given a list of fsspec OpenFiles, choose one to pass to geopandas.
+        Parse the pattern fields of each path, and drop the files rejected by
+        `pattern_filter`. The surviving field values are kept to set new columns.
         """
-        raise NotImplementedError(
-            "Opening multiple files is not supported by this driver"
-        )
+        if self.pattern is None:
+            return files
+        fields = pandas.DataFrame(reverse_formats(self.pattern, paths))
+        if self._pattern_filter:
+            keep = fields.eval(self._pattern_filter).to_numpy(dtype=bool)
+            files = [f for f, k in zip(files, keep) if k]
+            fields = fields[keep].reset_index(drop=True)
+        self._pattern_values = fields
+        return files
 
+    def _get_layer_infos(self):
+        """
+        Read the OGR layer metadata of every file, without reading features.
+        """
+        if self._layer_infos is None:
+            layer = self._geopandas_kwargs.get("layer")
+            self._layer_infos = [
+                _layer_info(f, layer=layer, engine=self._engine)
+                for f in self._get_files()
+            ]
+        return self._layer_infos
 
-class GeoJSONSource(GeoPandasFileSource):
-    name = "geojson"
+    def _get_partitions(self):
+        """
+        List the ``(file index, rows)`` pairs making up each partition, where
+        `rows` is a slice, or None to read the whole file.
+        """
+        if self._partitions is None:
+            files = self._get_files()
+            if self._chunksize is None:
+                self._partitions = [(i, None) for i in range(len(files))]
+            else:
+                self._partitions = []
+                for i, info in enumerate(self._get_layer_infos()):
+                    n = info["features"]
+                    self._partitions.extend(
+                        (i, slice(start, min(start + self._chunksize, n)))
+                        for start in range(0, max(n, 1), self._chunksize)
+                    )
+        return self._partitions
 
+    def _set_pattern_columns(self, df, i):
+        """
+        Add a categorical column for each pattern field of file `i`.
+        """
+        return _add_pattern_columns(df, self._get_pattern_fields(i))
 
-class ShapefileSource(GeoPandasFileSource):
-    name = "shapefile"
+    def _get_pattern_fields(self, i):
+        """
+        The categories and value of each pattern field of file `i`, or None.
+        """
+        if self._pattern_values is None:
+            return None
+        return {
+            field: (pandas.Index(values.unique()).sort_values(), values[i])
+            for field, values in self._pattern_values.items()
+        }
 
-    def _resolve_single_file(self, filelist):
+    def _resolve_files(self, filelist):
         """
-        Given a list of fsspec OpenFiles, find a .shp file.
+        Given a list of fsspec OpenFiles, choose the ones to pass to geopandas.
+        Each of them becomes a partition.
         """
-        local_files = fsspec.open_local(self.urlpath, **self.storage_options)
-        for f in local_files:
-            if f.endswith(".shp"):
-                return f
-        raise ValueError(
-            f"No shapefile found in {filelist}, if you are using fsspec caching"
-            " consider using same_names=True"
-        )
+        return filelist
 
+    def _select_paths(self, paths):
+        """
+        Given a list of expanded paths, choose the ones to pass to geopandas.
+        Each of them becomes a partition.
+        """
+        return paths
 
-class GeoParquetSource(GeoPandasFileSource):
-    name = "geoparquet"
+    def _read_file(self, f, rows=None):
+        """
+        Read a single file (a path or an fsspec OpenFile) using geopandas,
+        optionally restricted to a slice of `rows`.
+        """
+        return _read_ogr(f, rows, **self._get_read_options())
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._df = None
+    def _get_read_options(self):
+        """
+        The arguments of `_read_ogr` for the files of the source, resolved so
+        that partitions can be read without the source.
+        """
+        bounds_bbox = None
+        if self._bbox is not None and self._geometry == "bounds":
+            crs = self._get_layer_infos()[0]["crs"]
+            bounds_bbox = tuple(_resolve_bbox(self._bbox, crs)[0])
+        return dict(
+            engine=self._engine,
+            columns=self._columns,
+            where=self._where,
+            bbox=self._bbox,
+            bounds_bbox=bounds_bbox,
+            ignore_geometry=self._ignore_geometry,
+            geometry=self._geometry,
+            geopandas_kwargs=self._geopandas_kwargs,
+        )
+
+    def _get_partition_task(self, i):
+        """
+        A dask task reading partition `i` from its resolved file and rows,
+        with a module level function, so that workers do not resolve the
+        files of the source again.
+        """
+        import dask
+
+        file_index, rows = self._get_partitions()[i]
+        return dask.delayed(_read_ogr_partition)(
+            self._get_files()[file_index],
+            rows,
+            self._get_read_options(),
+            self._get_pattern_fields(file_index),
+        )
 
     def _open_dataset(self):
         """
-        Open dataset using geopandas.
+        Open dataset using geopandas, concatenating the partitions.
         """
-        if self._use_fsspec:
-            with fsspec.open_files(self.urlpath, **self.storage_options) as f:
-                f = self._resolve_single_file(f) if len(f) > 1 else f[0]
-                self._dataframe = geopandas.read_parquet(
-                    f,
-                    **self._geopandas_kwargs,
-                )
+        parts = [self._read_partition(i) for i in range(len(self._get_partitions()))]
+        if len(parts) == 0:
+            self._dataframe = self._get_meta()
+        elif len(parts) == 1:
+            self._dataframe = parts[0]
         else:
-            self._dataframe = geopandas.read_parquet(
-                self.urlpath, **self._geopandas_kwargs
-            )
+            self._dataframe = pandas.concat(parts, ignore_index=True)
 
     def _get_schema(self):
-        if self._df is None:
-            self._df = self._to_dask()
-        dtypes = {k: str(v) for k, v in self._df._meta.dtypes.items()}
-        self._schema = Schema(
+        partitions = self._get_partitions()
+        infos = self._get_layer_infos()
+        dtypes = dict(infos[0]["dtypes"])
+        if self._columns is not None:
+            dtypes = {k: v for k, v in dtypes.items() if k in self._columns}
+        geometry = None
+        if self._geometry == "bounds":
+            dtypes.update(dict.fromkeys(_BOUNDS, "float64"))
+        elif not self._ignore_geometry:
+            geometry = "geometry"
+            dtypes[geometry] = "geometry"
+        if self._pattern_values is not None:
+            dtypes.update({field: "category" for field in self._pattern_values})
+        # Counts and bounds in the metadata ignore any spatial or attribute filter
+        nrows = None
+        bounds = None
+        if self._bbox is None and self._where is None:
+            counts = [info["features"] for info in infos]
+            nrows = sum(counts) if min(counts) >= 0 else None
+            if all(info["total_bounds"] is not None for info in infos):
+                b = numpy.array([info["total_bounds"] for info in infos])
+                bounds = (*b[:, :2].min(axis=0), *b[:, 2:].max(axis=0))
+                bounds = tuple(float(x) for x in bounds)
+        return Schema(
             datashape=None,
             dtype=dtypes,
-            shape=(None, len(self._df.columns)),
-            npartitions=self._df.npartitions,
-            extra_metadata={},
+            shape=(nrows, len(dtypes)),
+            npartitions=len(partitions),
+            extra_metadata={
+                "geometry": geometry,
+                "crs": infos[0]["crs"],
+                "geometry_type": infos[0]["geometry_type"],
+                "total_bounds": bounds,
+            },
         )
-        return self._schema
 
-    def to_dask(self):
-        self._load_metadata()
-        return self._df
+    def _read_partition(self, i):
+        file_index, rows = self._get_partitions()[i]
+        df = self._read_file(self._get_files()[file_index], rows=rows)
+        return self._set_pattern_columns(df, file_index)
+
+    def _get_partition(self, i):
+        return self._read_partition(i)
 
     def read(self):
-        return self.to_dask().compute()
+        self._load_metadata()
+        if self._dataframe is None:
+            self._open_dataset()
+        return self._dataframe
 
-    def _to_dask(self):
+    def iter_chunks(self, chunksize=100_000):
         """
-        Create a lazy dask-geodataframe using dask-geopandas
+        Yield the data as frames of at most `chunksize` rows, streaming the
+        features of each file in a single pass, as Arrow batches with pyogrio
+        or from one fiona iterator, so that the whole dataset is never held in
+        memory.
         """
-        import dask_geopandas
+        self._load_metadata()
+        # Streamed frames are cast to the dtypes read() gives
+        dtypes = {
+            name: dtype
+            for name, dtype in self.dtype.items()
+            if dtype not in ("geometry", "category")
+        }
+        for i, f in enumerate(self._get_files()):
+            for df in self._iter_file(f, chunksize):
+                if len(df) > 0:
+                    df = df.astype({k: v for k, v in dtypes.items() if k in df})
+                    yield self._set_pattern_columns(df, i)
 
-        self._df = dask_geopandas.read_parquet(
-            self.urlpath, storage_options=self.storage_options, **self._geopandas_kwargs
-        )
+    def _iter_file(self, f, chunksize):
+        """
+        Stream the features of a single file (a path or an fsspec OpenFile) as
+        frames of `chunksize` rows.
+        """
+        if isinstance(f, fsspec.core.OpenFile):
+            with f as fobj:
+                yield from self._iter_file(fobj, chunksize)
+            return
+        layer = self._geopandas_kwargs.get("layer")
+        bbox = None
+        if self._bbox is not None:
+            crs = self._get_layer_infos()[0]["crs"]
+            bbox = tuple(_resolve_bbox(self._bbox, crs)[0])
+        if self._engine == "fiona":
+            frames = _iter_fiona(f, chunksize, layer, bbox, self._where)
+        else:
+            frames = _iter_arrow(
+                f,
+                chunksize,
+                layer,
+                bbox,
+                self._where,
+                self._columns,
+                read_geometry=not self._ignore_geometry,
+            )
+        for df in frames:
+            if self._columns is not None:
+                keep = [*self._columns, "geometry"]
+                df = df[[c for c in df.columns if c in keep]]
+            if self._ignore_geometry:
+                df = pandas.DataFrame(df.drop(columns="geometry", errors="ignore"))
+            elif self._geometry == "bounds":
+                df = _bounds_frame(df)
+            yield df
+
+    def _get_meta(self):
+        """
+        Build an empty GeoDataFrame matching the schema, for use as dask `_meta`,
+        or a plain DataFrame when the source has no geometry column.
+        """
         self._load_metadata()
-        return self._df
+        columns = {}
+        for name, dtype in self.dtype.items():
+            if dtype == "geometry":
+                columns[name] = geopandas.GeoSeries([], crs=self.metadata["crs"])
+            elif self._pattern_values is not None and name in self._pattern_values:
+                categories = self._pattern_values[name].unique()
+                columns[name] = pandas.Categorical([], numpy.sort(categories))
+            else:
+                columns[name] = pandas.Series([], dtype=dtype)
+        if self.metadata["geometry"] is None:
+            return pandas.DataFrame(columns)
+        return geopandas.GeoDataFrame(
+            columns, geometry=self.metadata["geometry"], crs=self.metadata["crs"]
+        )
+
+    def to_dask(self):
+        """
+        Create a lazy dask-geodataframe with one task per partition, so that
+        partitions are read on the workers.
+        """
+        import dask
+        import dask.dataframe as dd
+        import dask_geopandas  # noqa: F401, registers the geopandas dask backend
 
+        meta = self._get_meta()
+        parts = [
+            self._get_partition_task(i) for i in range(len(self._get_partitions()))
+        ]
+        if len(parts) == 0:
+            return dd.from_pandas(meta, npartitions=1)
+        return dd.from_delayed(parts, meta=meta)
+
+    def _close(self):
+        self._dataframe = None
+        self._files = None
+        self._partitions = None
+        self._layer_infos = None
+        self._pattern_values = None
+
+
+# The dtypes geopandas gives to fiona field types, where all integers are read
+# as int64 and dates as Python objects
+_FIONA_DTYPES = {
+    "str": "object",
+    "int": "int64",
+    "int16": "int64",
+    "int32": "int64",
+    "int64": "int64",
+    "float": "float64",
+    "bool": "bool",
+    "date": "object",
+    "time": "object",
+    "datetime": "datetime64[ms]",
+}
+
+
+_ENGINES = ("fiona", "pyogrio", "pyogrio+arrow")
+
+_BOUNDS = ["minx", "miny", "maxx", "maxy"]
+
+
+def _resolve_engine(engine):
+    """
+    Check the requested read engine, or pick the fastest one installed.
+    """
+    if engine is not None:
+        if engine not in _ENGINES:
+            raise ValueError(f"engine must be one of {_ENGINES}, got {engine!r}")
+        return engine
+    try:
+        import pyogrio  # noqa: F401
+    except ImportError:
+        return "fiona"
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "pyogrio"
+    return "pyogrio+arrow"
+
+
+def _check_geometry(geometry, ignore_geometry):
+    """
+    Check the requested geometry read mode.
+    """
+    if geometry not in (None, "bounds"):
+        raise ValueError(f"geometry must be None or 'bounds', got {geometry!r}")
+    if geometry is not None and ignore_geometry:
+        raise ValueError("geometry cannot be combined with ignore_geometry=True")
+
+
+def _read_ogr(
+    f,
+    rows,
+    engine,
+    columns,
+    where,
+    bbox,
+    bounds_bbox,
+    ignore_geometry,
+    geometry,
+    geopandas_kwargs,
+):
+    """
+    Read a single file (a path or an fsspec OpenFile) using geopandas,
+    optionally restricted to a slice of `rows`. With ``geometry="bounds"``,
+    `bounds_bbox` is the `bbox` bounds in the CRS of the layer.
+    """
+    kwargs = dict(engine=engine.split("+")[0])
+    # GDAL's Arrow stream skips features before applying a spatial filter,
+    # so slices of a bbox are read feature by feature
+    if engine == "pyogrio+arrow" and (rows is None or bbox is None):
+        kwargs["use_arrow"] = True
+    if columns is not None:
+        kwargs["columns"] = list(columns)
+    if where is not None:
+        kwargs["where"] = where
+    # fiona has no envelope reader, so its bounds come from the geometries
+    read_bounds = geometry == "bounds" and engine != "fiona"
+    if ignore_geometry or read_bounds:
+        kwargs["ignore_geometry"] = True
+    if read_bounds:
+        kwargs["fid_as_index"] = True
+    kwargs.update(geopandas_kwargs)
+    if rows is not None:
+        kwargs["rows"] = rows
+    df = _read_with(f, geopandas.read_file, bbox=bbox, **kwargs)
+    if geometry != "bounds":
+        return df
+    if not read_bounds:
+        return _bounds_frame(df)
+    return _join_bounds(f, df, kwargs, bounds_bbox)
+
+
+def _join_bounds(f, df, kwargs, bbox):
+    """
+    Read the envelope of each feature with OGR, and join them to the
+    attributes in `df` by feature id.
+    """
+    import pyogrio
+
+    if len(df) == 0:
+        # read_bounds raises when skipping all the features left by a filter
+        df = df.reset_index(drop=True)
+        return df.assign(**{name: numpy.empty(0) for name in _BOUNDS})
+    bounds_kwargs = dict(layer=kwargs.get("layer"), where=kwargs.get("where"))
+    rows = kwargs.get("rows")
+    if rows is not None:
+        bounds_kwargs.update(
+            skip_features=rows.start, max_features=rows.stop - rows.start
+        )
+    if bbox is not None:
+        bounds_kwargs["bbox"] = bbox
+    fids, bounds = _read_with(f, pyogrio.read_bounds, **bounds_kwargs)
+    bounds = pandas.DataFrame(bounds.T, index=fids, columns=_BOUNDS)
+    df = pandas.concat([df, bounds.reindex(df.index)], axis=1)
+    return df.reset_index(drop=True)
+
+
+def _read_ogr_partition(f, rows, options, pattern_fields):
+    """
+    Read a partition of a file source in a dask task.
+    """
+    return _add_pattern_columns(_read_ogr(f, rows, **options), pattern_fields)
+
+
+def _add_pattern_columns(df, pattern_fields):
+    """
+    Add a categorical column for each pattern field, given as categories and
+    the value of the file.
+    """
+    if pattern_fields is None:
+        return df
+    columns = {}
+    for field, (categories, value) in pattern_fields.items():
+        codes = numpy.full(len(df), categories.get_loc(value), dtype="int32")
+        columns[field] = pandas.Categorical.from_codes(codes, categories)
+    return df.assign(**columns)
+
+
+def _read_with(f, func, **kwargs):
+    """
+    Call a reader `func` on a path, or on an fsspec OpenFile opened for it.
+    """
+    if isinstance(f, fsspec.core.OpenFile):
+        with f as fobj:
+            return func(fobj, **kwargs)
+    return func(f, **kwargs)
+
+
+def _bounds_frame(gdf):
+    """
+    Replace the active geometry of a GeoDataFrame by float64 minx, miny, maxx
+    and maxy columns, giving a plain DataFrame.
+    """
+    df = pandas.DataFrame(gdf.drop(columns=gdf.geometry.name))
+    return pandas.concat([df, gdf.geometry.bounds], axis=1)
+
+
+def _iter_arrow(f, chunksize, layer, bbox, where, columns, read_geometry=True):
+    """
+    Stream an OGR layer with pyogrio as GeoDataFrames built from Arrow record
+    batches of `chunksize` features.
+    """
+    import pyarrow
+    from pyogrio.raw import open_arrow
+
+    with open_arrow(
+        f,
+        layer=layer,
+        bbox=bbox,
+        where=where,
+        columns=columns,
+        read_geometry=read_geometry,
+        batch_size=chunksize,
+        use_pyarrow=True,
+        datetime_as_string=True,
+    ) as (meta, reader):
+        geometry = meta["geometry_name"] or "wkb_geometry"
+        # Datetimes are parsed from strings as by pyogrio.read_dataframe, so
+        # that their time zone is kept
+        datetimes = [
+            name
+            for name, kind in zip(meta["fields"], meta["ogr_types"])
+            if kind == "OFTDateTime"
+        ]
+        for batch in reader:
+            df = pyarrow.Table.from_batches([batch]).to_pandas()
+            for name in datetimes:
+                if name in df:
+                    df[name] = pandas.to_datetime(df[name], format="ISO8601")
+            if geometry not in df:
+                yield df
+                continue
+            geoms = shapely.from_wkb(df.pop(geometry).to_numpy())
+            yield geopandas.GeoDataFrame(df, geometry=geoms, crs=meta["crs"])
+
+
+def _iter_fiona(f, chunksize, layer, bbox, where):
+    """
+    Stream an OGR layer with a single fiona iterator as GeoDataFrames of
+    `chunksize` features.
+    """
+    import itertools
+
+    import fiona
+
+    with fiona.open(f, layer=layer) as collection:
+        features = collection.filter(bbox=bbox, where=where)
+        columns = list(collection.schema["properties"]) + ["geometry"]
+        while True:
+            batch = list(itertools.islice(features, chunksize))
+            if not batch:
+                break
+            yield geopandas.GeoDataFrame.from_features(
+                batch, crs=collection.crs_wkt or None, columns=columns
+            )
+
+
+def _layer_info(f, layer=None, engine="pyogrio"):
+    """
+    Get field dtypes, feature count, CRS, geometry type and total bounds of an
+    OGR layer from its metadata, without reading the features themselves.
+    """
+    if isinstance(f, fsspec.core.OpenFile):
+        with f as fobj:
+            return _layer_info(fobj, layer=layer, engine=engine)
+    if engine == "fiona":
+        import fiona
+
+        with fiona.open(f, layer=layer) as collection:
+            info = {
+                "dtypes": {
+                    name: _FIONA_DTYPES.get(kind.split(":")[0], "object")
+                    for name, kind in collection.schema["properties"].items()
+                },
+                "features": len(collection),
+                "crs": collection.crs_wkt or None,
+                "geometry_type": collection.schema["geometry"],
+                "total_bounds": collection.bounds,
+            }
+    else:
+        import pyogrio
+
+        raw = pyogrio.read_info(f, layer=layer, force_feature_count=True)
+        # Date fields are read as datetime64[ms], or as Python dates by Arrow
+        date = "object" if engine == "pyogrio+arrow" else "datetime64[ms]"
+        info = {
+            "dtypes": {
+                name: date if dtype == "datetime64[D]" else dtype
+                for name, dtype in zip(raw["fields"], raw["dtypes"])
+            },
+            "features": raw["features"],
+            "crs": raw["crs"],
+            "geometry_type": raw["geometry_type"],
+            "total_bounds": raw.get("total_bounds"),
+        }
+    if info["crs"] is not None:
+        info["crs"] = CRS.from_user_input(info["crs"]).to_string()
+    return info
+
+
+def _expand_urlpath(urlpath, storage_options):
+    """
+    Expand glob patterns in `urlpath` without opening the files, so that the
+    resulting paths can be passed straight to geopandas.
+    """
+    urlpaths = [urlpath] if isinstance(urlpath, str) else list(urlpath)
+    files = []
+    for u in urlpaths:
+        if "*" not in u:
+            files.append(u)
+            continue
+        fs, _, paths = fsspec.get_fs_token_paths(u, storage_options=storage_options)
+        if len(paths) == 0:
+            raise FileNotFoundError(f"No files found matching {u}")
+        files.extend(
+            p if _is_local(fs) else fs.unstrip_protocol(p) for p in sorted(paths)
+        )
+    return files
+
+
+def _is_local(fs):
+    protocol = fs.protocol if isinstance(fs.protocol, tuple) else (fs.protocol,)
+    return "file" in protocol
+
+
+class GeoJSONSource(GeoPandasFileSource):
+    name = "geojson"
+
+
+class ShapefileSource(GeoPandasFileSource):
+    name = "shapefile"
+
+    sidecars = (".shp", ".shx", ".dbf", ".prj", ".cpg")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tempdir = None
+
+    def _resolve_files(self, filelist):
+        """
+        Given a list of fsspec OpenFiles, find the .shp files and make each of
+        them and its sidecar files available locally, fetching every remote
+        file exactly once.
+        """
+        if len(filelist) == 1 and not filelist[0].path.lower().endswith(".shp"):
+            # e.g. a zipped shapefile, which geopandas opens directly
+            return filelist
+        fs = filelist[0].fs
+        groups = {}
+        shp_indices = []
+        for i, f in enumerate(filelist):
+            stem, ext = posixpath.splitext(f.path)
+            if ext.lower() in self.sidecars:
+                groups.setdefault(stem, {})[ext.lower()] = f
+                if ext.lower() == ".shp":
+                    shp_indices.append(i)
+        shapefiles = [
+            groups[posixpath.splitext(filelist[i].path)[0]] for i in shp_indices
+        ]
+        if not shapefiles:
+            raise ValueError(
+                f"No shapefile found in {filelist}, if you are using fsspec caching"
+                " consider using same_names=True"
+            )
+        self._keep_pattern_values(shp_indices)
+        if _is_local(fs):
+            return [group[".shp"].path for group in shapefiles]
+
+        for group in shapefiles:
+            if ".dbf" not in group:
+                # The sidecars did not match the urlpath, try them next to the .shp
+                stem = posixpath.splitext(group[".shp"].path)[0]
+                for ext in self.sidecars:
+                    group.setdefault(ext, fsspec.core.OpenFile(fs, stem + ext))
+        needed = [f for group in shapefiles for f in group.values()]
+        if getattr(fs, "local_file", False):
+            # Caching filesystems download each file to their cache on open
+            fetch = _cached_path
+        else:
+            self._tempdir = self._tempdir or tempfile.mkdtemp(prefix="intake_geopandas")
+            fetch = partial(_download, tempdir=self._tempdir)
+        with ThreadPoolExecutor(max_workers=min(16, len(needed))) as pool:
+            local = dict(zip(map(id, needed), pool.map(partial(_fetch, fetch), needed)))
+        paths = [local[id(group[".shp"])] for group in shapefiles]
+        if not all(path is not None and path.endswith(".shp") for path in paths):
+            raise ValueError(
+                f"No shapefile found in {paths}, if you are using fsspec caching"
+                " consider using same_names=True"
+            )
+        return paths
+
+    def _select_paths(self, paths):
+        """
+        Keep the .shp files of a list of expanded paths, such as those of
+        ``stations.*``, as geopandas finds their sidecar files next to them.
+        """
+        if len(paths) == 1:
+            # e.g. a zipped shapefile, which geopandas opens directly
+            return paths
+        shp_indices = [i for i, p in enumerate(paths) if p.lower().endswith(".shp")]
+        if not shp_indices:
+            raise ValueError(f"No shapefile found in {paths}")
+        self._keep_pattern_values(shp_indices)
+        return [paths[i] for i in shp_indices]
+
+    def _keep_pattern_values(self, indices):
+        """
+        Only keep the pattern field values of the files at `indices`, the .shp
+        files that become partitions.
+        """
+        if self._pattern_values is not None:
+            self._pattern_values = self._pattern_values.iloc[indices].reset_index(
+                drop=True
+            )
+
+    def _close(self):
+        super()._close()
+        if self._tempdir is not None:
+            shutil.rmtree(self._tempdir, ignore_errors=True)
+            self._tempdir = None
+
+
+def _fetch(fetch, f):
+    try:
+        return fetch(f)
+    except FileNotFoundError:
+        # Optional sidecars such as .cpg may not exist
+        return None
+
+
+def _cached_path(f):
+    from fsspec.implementations.cached import SimpleCacheFileSystem
+
+    fs = f.fs
+    if not isinstance(fs, SimpleCacheFileSystem) or fs.compression:
+        with f as fobj:
+            return fobj.name
+    # Opening the file checks that it exists with a request of its own, so
+    # download it straight into the cache instead
+    path = fs._strip_protocol(f.path)
+    local = fs._check_file(path)
+    if local is None:
+        local = os.path.join(fs.storage[-1], fs._mapper(path))
+        # Through a temporary file, so that other readers never see a partial one
+        fd, tmp = tempfile.mkstemp(dir=fs.storage[-1], suffix=".tmp")
+        os.close(fd)
+        try:
+            fs.fs.get_file(path, tmp)
+            os.replace(tmp, local)
+        finally:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+    return local
+
+
+def _download(f, tempdir):
+    # Keep the directory structure so that sidecars with the same stem stay
+    # next to each other, and same-named files in different folders do not clash
+    local = os.path.join(tempdir, *f.path.strip("/").split("/"))
+    os.makedirs(os.path.dirname(local), exist_ok=True)
+    f.fs.get_file(f.path, local)
+    return local
+
+
+class GeoParquetSource(GeoPandasFileSource):
+    name = "geoparquet"
 
-class GeoPandasSQLSource(GeoPandasSource):
     def __init__(
-        self, uri, sql_expr=None, table=None, geopandas_kwargs=None, metadata=None
+        self,
+        *args,
+        columns=None,
+        filters=None,
+        use_threads=True,
+        pre_buffer=True,
+        memory_pool=None,
+        **kwargs,
     ):
         """
+        A source for GeoParquet files, opened with pyarrow and dask-geopandas.
+        Takes the same arguments as `GeoPandasFileSource`, except the OGR
+        reading arguments `chunksize`, `engine`, `where` and `pattern_filter`,
+        and:
+
         Parameters
         ----------
-        uri : str
-            The connection string for the PostGIS database.
-        sql_expr: str, optional
-            The SQL expression used to load from the database.
-            Must include either `sql_expr` or `table`.
-        table: str, optional
-            The table to load from the database.
-            This is ignored if `sql_expr` is provided.
-        geopandas_kwargs : dict
-            Any further arguments to pass to geopandas's read_postgis function.
+        columns : list of str, optional
+            Only read these columns. The primary geometry column is always read,
+            unless `ignore_geometry` is set.
+
+        filters : list of tuples or list of lists of tuples, optional
+            Row filters in pyarrow's DNF format, e.g. ``[("pop", ">", 1000)]``,
+            pushed down to skip row groups using their column statistics.
+
+        use_threads : bool
+            Whether `read()` decodes columns and row groups on multiple threads.
+
+        pre_buffer : bool
+            Whether `read()` coalesces and prefetches column chunk reads, which
+            helps most on high-latency filesystems such as object stores.
+
+        memory_pool : str, optional
+            The pyarrow memory pool used by `read()`, one of ``"system"``,
+            ``"jemalloc"`` or ``"mimalloc"``. Defaults to pyarrow's default pool.
+
+        Any ``columns`` and ``filters`` in `geopandas_kwargs` are used as the
+        arguments above. Other `geopandas_kwargs` are passed to
+        dask-geopandas's read_parquet, through which `read()` then goes too,
+        and are not supported with `bbox` or ``geometry="bounds"``.
         """
-        self.uri = uri
-        if sql_expr:
-            self.sql_expr = sql_expr
-        elif table:
-            self.sql_expr = f"SELECT * FROM {table}"
-        else:
-            raise ValueError("Must provide either a sql_expr or a table")
+        super().__init__(*args, **kwargs)
+        unsupported = {
+            "chunksize": self._chunksize,
+            "engine": kwargs.get("engine"),
+            "where": self._where,
+            "pattern_filter": self._pattern_filter,
+        }
+        unsupported = [name for name, value in unsupported.items() if value is not None]
+        if unsupported:
+            raise ValueError(
+                f"{unsupported} are not supported by GeoParquetSource, use "
+                "filters and columns instead"
+            )
+        geopandas_kwargs = dict(self._geopandas_kwargs)
+        if "columns" in geopandas_kwargs:
+            if columns is not None:
+                raise ValueError("columns is given twice")
+            columns = geopandas_kwargs.pop("columns")
+        if "filters" in geopandas_kwargs:
+            if filters is not None:
+                raise ValueError("filters is given twice")
+            filters = geopandas_kwargs.pop("filters")
+        if geopandas_kwargs and (self._bbox is not None or self._geometry is not None):
+            raise ValueError(
+                f"geopandas_kwargs {sorted(geopandas_kwargs)} are not supported "
+                "with bbox or geometry='bounds'"
+            )
+        self._geopandas_kwargs = geopandas_kwargs
+        self._columns = columns
+        self._filters = _normalize_filters(filters)
+        self._use_threads = use_threads
+        self._pre_buffer = pre_buffer
+        self._memory_pool = memory_pool
+        self._df = None
+        self._fs = None
+        self._footers = None
 
-        self._geopandas_kwargs = geopandas_kwargs or {}
-        self._dataframe = None
+    def _get_files(self):
+        """
+        List the parquet files of the dataset, expanding globs and directories.
+        The ``key=value`` directories of a hive partitioned dataset are kept as
+        pattern fields, to set the partition columns missing from the files.
+        """
+        if self._files is None:
+            fs, _, paths = fsspec.get_fs_token_paths(
+                self.urlpath, storage_options=self.storage_options
+            )
+            if len(paths) == 1 and fs.isdir(paths[0]):
+                root = paths[0]
+                paths = sorted(
+                    p
+                    for p in fs.find(root)
+                    if not posixpath.basename(p).startswith(("_", "."))
+                )
+            elif paths:
+                root = posixpath.commonpath([posixpath.dirname(p) for p in paths])
+            if len(paths) == 0:
+                raise FileNotFoundError(f"No files found matching {self.urlpath}")
+            self._fs = fs
+            self._files = paths
+            self._pattern_values = _hive_values(root, paths)
+        return self._files
 
-        super().__init__(metadata=metadata)
+    def _get_partitioning(self):
+        """
+        The pyarrow hive partitioning of the dataset, with the partition
+        columns as dictionaries like pyarrow infers them, or None.
+        """
+        fields = self._get_pattern_fields(0)
+        if fields is None:
+            return None
+        import pyarrow
+        import pyarrow.dataset as ds
 
-    def _open_dataset(self):
-        self._dataframe = geopandas.read_postgis(
-            self.sql_expr, self.uri, **self._geopandas_kwargs
+        dictionaries = {
+            field: pyarrow.array(categories.to_numpy())
+            for field, (categories, _) in fields.items()
+        }
+        schema = pyarrow.schema(
+            [
+                (field, pyarrow.dictionary(pyarrow.int32(), values.type))
+                for field, values in dictionaries.items()
+            ]
         )
+        return ds.partitioning(schema, dictionaries=dictionaries, flavor="hive")
 
+    def _get_partitions(self):
+        """
+        List the ``(file index, row groups)`` pairs making up each partition.
+        With a `bbox`, files and row groups whose bounds do not intersect it
+        are pruned; otherwise row groups is None and whole files are read.
+        """
+        if self._partitions is None:
+            footers = self._get_footers()
+            if self._bbox is None:
+                self._partitions = [(i, None) for i in range(len(footers))]
+            else:
+                geometry = self._get_geo()["primary_column"]
+                bounds, _ = self._get_bbox()
+                self._partitions = []
+                for i, footer in enumerate(footers):
+                    row_groups = [
+                        j
+                        for j, b in enumerate(_row_group_bounds(footer, geometry))
+                        if b is None or _bounds_intersect(b, bounds)
+                    ]
+                    if row_groups:
+                        self._partitions.append((i, row_groups))
+        return self._partitions
 
-class PostGISSource(GeoPandasSQLSource):
-    name = "postgis"
+    def _get_geo(self):
+        """
+        The GeoParquet `geo` metadata of the first file.
+        """
+        return json.loads(self._get_footers()[0].metadata[b"geo"])
 
+    def _get_bbox(self):
+        """
+        Resolve `bbox` to its bounds and geometry in the CRS of the dataset.
+        """
+        column = self._get_geo()["columns"][self._get_geo()["primary_column"]]
+        return _resolve_bbox(self._bbox, column.get("crs", "OGC:CRS84"))
 
-class SpatiaLiteSource(GeoPandasSQLSource):
-    name = "spatialite"
+    def _get_footers(self):
+        """
+        Read the footer metadata of every file, without reading any data pages.
+        """
+        if self._footers is None:
+            files = self._get_files()
+            with ThreadPoolExecutor(max_workers=min(32, len(files))) as pool:
+                self._footers = list(
+                    pool.map(partial(_read_parquet_footer, self._fs), files)
+                )
+        return self._footers
+
+    def _read_file(self, f, rows=None):
+        """
+        Read a single file of the dataset using geopandas.
+        """
+        return _read_parquet_file(self._fs, f, self._get_read_options())
+
+    def _get_read_options(self):
+        """
+        The arguments of the GeoParquet readers, resolved from the footers so
+        that partitions can be read without the source.
+        """
+        return dict(
+            geo=self._get_geo(),
+            columns=self._get_columns(),
+            read_columns=self._read_columns(),
+            attributes=self._get_attributes(),
+            filters=self._filters,
+            bbox=None if self._bbox is None else self._get_bbox(),
+            ignore_geometry=self._ignore_geometry,
+            geometry=self._geometry,
+            geopandas_kwargs=self._geopandas_kwargs,
+        )
+
+    def _get_partition_task(self, i):
+        """
+        A dask task reading the row groups of partition `i` with a module level
+        function.
+        """
+        import dask
+
+        file_index, row_groups = self._get_partitions()[i]
+        return dask.delayed(_read_parquet_partition)(
+            self._fs,
+            self._get_files()[file_index],
+            row_groups,
+            self._get_read_options(),
+            self._get_pattern_fields(file_index),
+        )
+
+    def _get_columns(self):
+        """
+        The projected columns, always including the primary geometry column.
+        When the geometry is ignored, only the attribute columns are read, and
+        for bounds, the bbox covering column is read instead of the geometry
+        when there is one.
+        """
+        geo = self._get_geo()
+        geometry = geo["primary_column"]
+        if self._ignore_geometry:
+            return self._get_attributes()
+        if self._geometry == "bounds":
+            covering = geo["columns"][geometry].get("covering", {}).get("bbox")
+            if covering is not None:
+                return self._get_attributes() + [covering["xmin"][0]]
+            return self._get_attributes() + [geometry]
+        if self._columns is None:
+            return None
+        columns = list(self._columns)
+        return columns if geometry in columns else columns + [geometry]
+
+    def _get_attributes(self):
+        """
+        The projected attribute columns, without any geometry or bbox covering
+        column.
+        """
+        geo = self._get_geo()
+        columns = self._columns
+        if columns is None:
+            schema = self._get_footers()[0].schema.to_arrow_schema()
+            index = (schema.pandas_metadata or {}).get("index_columns", [])
+            columns = [name for name in schema.names if name not in index]
+            if self._pattern_values is not None:
+                columns += list(self._pattern_values.columns)
+        # Bbox covering columns are derived from the geometry too
+        skip = set(geo["columns"])
+        for column in geo["columns"].values():
+            covering = column.get("covering", {}).get("bbox")
+            if covering is not None:
+                skip.add(covering["xmin"][0])
+        return [c for c in columns if c not in skip]
+
+    def _read_columns(self):
+        """
+        The columns to read, adding those needed to filter to the projection.
+        They are dropped again by `_to_frame`.
+        """
+        columns = self._get_columns()
+        if columns is None:
+            return None
+        columns = columns + [
+            c for c in _filter_columns(self._filters) if c not in columns
+        ]
+        if self._bbox is not None:
+            geo = self._get_geo()
+            geometry = geo["primary_column"]
+            covering = geo["columns"][geometry].get("covering", {}).get("bbox")
+            if covering is not None and covering["xmin"][0] not in columns:
+                columns.append(covering["xmin"][0])
+            # An ignored geometry is still needed to filter exactly on the bbox
+            if geometry not in columns:
+                columns.append(geometry)
+        return columns
+
+    def _to_frame(self, table):
+        """
+        Filter a pyarrow Table read with `_read_columns` on `bbox` and
+        `filters`, and convert it to the output frame.
+        """
+        return _parquet_to_frame(table, self._get_read_options())
+
+    def _read_partition(self, i):
+        file_index, row_groups = self._get_partitions()[i]
+        return _read_parquet_partition(
+            self._fs,
+            self._get_files()[file_index],
+            row_groups,
+            self._get_read_options(),
+            self._get_pattern_fields(file_index),
+        )
+
+    def iter_chunks(self, chunksize=100_000):
+        """
+        Yield the data as frames of at most `chunksize` rows, streaming record
+        batches from the row groups left after `bbox` pruning, so that the
+        whole dataset is never held in memory.
+        """
+        import pyarrow
+        import pyarrow.parquet as pq
+
+        self._load_metadata()
+        files = self._get_files()
+        for file_index, row_groups in self._get_partitions():
+            pattern_fields = self._get_pattern_fields(file_index)
+            with self._fs.open(files[file_index], "rb") as f:
+                pf = pq.ParquetFile(f)
+                batches = pf.iter_batches(
+                    batch_size=chunksize,
+                    row_groups=row_groups,
+                    columns=_file_columns(self._read_columns(), pattern_fields),
+                    use_pandas_metadata=True,
+                )
+                for batch in batches:
+                    table = pyarrow.Table.from_batches([batch])
+                    table = table.replace_schema_metadata(pf.schema_arrow.metadata)
+                    table = _append_pattern_columns(table, pattern_fields)
+                    df = self._to_frame(table)
+                    if len(df) > 0:
+                        yield df
+
+    def _get_schema(self):
+        footers = self._get_footers()
+        geo = json.loads(footers[0].metadata[b"geo"])
+        dtypes = {
+            k: str(v)
+            for k, v in footers[0]
+            .schema.to_arrow_schema()
+            .empty_table()
+            .to_pandas()
+            .dtypes.items()
+        }
+        if self._pattern_values is not None:
+            dtypes.update({field: "category" for field in self._pattern_values})
+        dtypes.update({name: "geometry" for name in geo["columns"]})
+        if self._ignore_geometry or self._geometry == "bounds":
+            dtypes = {name: dtypes[name] for name in self._get_attributes()}
+            if self._geometry == "bounds":
+                dtypes.update(dict.fromkeys(_BOUNDS, "float64"))
+        elif self._columns is not None:
+            dtypes = {name: dtypes[name] for name in self._get_columns()}
+        geometry = geo["primary_column"]
+        column = geo["columns"][geometry]
+        # A missing crs means OGC:CRS84, an explicit null means unknown
+        crs = column.get("crs", "OGC:CRS84")
+        if crs is not None:
+            crs = CRS.from_user_input(crs).to_string()
+        geometry_type = column.get("geometry_types", column.get("geometry_type"))
+
+        row_group_bounds = []
+        for footer in footers:
+            row_group_bounds.extend(_row_group_bounds(footer, geometry))
+        bounds = None
+        if row_group_bounds and all(b is not None for b in row_group_bounds):
+            b = numpy.array(row_group_bounds)
+            bounds = (*b[:, :2].min(axis=0), *b[:, 2:].max(axis=0))
+            bounds = tuple(float(x) for x in bounds)
+
+        nrows = None
+        if self._bbox is None and not self._filters:
+            nrows = sum(footer.num_rows for footer in footers)
+        return Schema(
+            datashape=None,
+            dtype=dtypes,
+            shape=(nrows, len(dtypes)),
+            npartitions=len(self._get_partitions()),
+            extra_metadata={
+                "geometry": (
+                    None
+                    if self._ignore_geometry or self._geometry == "bounds"
+                    else geometry
+                ),
+                "crs": crs,
+                "geometry_type": geometry_type,
+                "total_bounds": bounds,
+                "row_group_bounds": row_group_bounds,
+            },
+        )
+
+    def to_dask(self):
+        self._load_metadata()
+        if self._bbox is not None or self._geometry == "bounds":
+            # Pruned row groups do not map onto dask-geopandas partitions, and
+            # bounds are computed by reading each partition
+            return super().to_dask()
+        if self._df is None:
+            self._df = self._to_dask()
+        return self._df
+
+    def _open_dataset(self):
+        """
+        Read the whole dataset with a single multithreaded pyarrow read,
+        without going through dask.
+        """
+        if self._bbox is not None:
+            # Row groups are pruned per partition
+            return super()._open_dataset()
+        if self._geopandas_kwargs:
+            # Only dask-geopandas knows about the other arguments
+            self._dataframe = self.to_dask().compute()
+            return
+        import pyarrow
+        import pyarrow.parquet as pq
+
+        memory_pool = None
+        if self._memory_pool is not None:
+            memory_pool = getattr(pyarrow, f"{self._memory_pool}_memory_pool")()
+        table = pq.read_table(
+            self._get_files(),
+            filesystem=self._fs,
+            columns=self._get_columns(),
+            filters=self._filters,
+            use_threads=self._use_threads,
+            pre_buffer=self._pre_buffer,
+            memory_map=False,
+            use_pandas_metadata=True,
+            partitioning=self._get_partitioning(),
+        )
+        convert = _arrow_to_geodataframe
+        if self._geometry == "bounds":
+            convert = _arrow_to_bounds
+        self._dataframe = convert(
+            table,
+            use_threads=self._use_threads,
+            memory_pool=memory_pool,
+            split_blocks=True,
+            self_destruct=True,
+        )
+
+    def _to_dask(self):
+        """
+        Create a lazy dask-geodataframe using dask-geopandas, with one
+        partition per file to match the schema.
+        """
+        kwargs = dict(
+            split_row_groups=False, columns=self._get_columns(), filters=self._filters
+        )
+        kwargs.update(self._geopandas_kwargs)
+        if self._ignore_geometry:
+            import dask.dataframe as dd
+
+            return dd.read_parquet(
+                self.urlpath, storage_options=self.storage_options, **kwargs
+            )
+        import dask_geopandas
+
+        return dask_geopandas.read_parquet(
+            self.urlpath, storage_options=self.storage_options, **kwargs
+        )
+
+    def _close(self):
+        super()._close()
+        self._df = None
+        self._fs = None
+        self._footers = None
+
+
+def _resolve_bbox(bbox, crs):
+    """
+    Given a bbox tuple, shapely geometry, GeoSeries or GeoDataFrame, return
+    its bounds and its geometry, reprojected to `crs` where possible.
+    """
+    if isinstance(bbox, (geopandas.GeoSeries, geopandas.GeoDataFrame)):
+        if bbox.crs is not None and crs is not None:
+            bbox = bbox.to_crs(crs)
+        geometry = unary_union(list(bbox.geometry))
+    elif isinstance(bbox, BaseGeometry):
+        geometry = bbox
+    else:
+        geometry = box(*bbox)
+    return geometry.bounds, geometry
+
+
+def _normalize_filters(filters):
+    """
+    Turn DNF `filters` given as lists, as they are in YAML catalogs, into the
+    tuples expected by pyarrow and dask.
+    """
+    if not filters:
+        return None
+    if isinstance(filters[0][0], str):
+        return [tuple(f) for f in filters]
+    return [[tuple(f) for f in conjunction] for conjunction in filters]
+
+
+def _filter_columns(filters):
+    """
+    The names of the columns used by pyarrow DNF `filters`.
+    """
+    if not filters:
+        return []
+    if isinstance(filters[0], tuple):
+        filters = [filters]
+    names = [name for conjunction in filters for name, _, _ in conjunction]
+    return list(dict.fromkeys(names))
+
+
+def _read_parquet_partition(fs, path, row_groups, options, pattern_fields=None):
+    """
+    Read the `row_groups` of the GeoParquet file at `path`, or the whole file
+    when `row_groups` is None, with the options of
+    `GeoParquetSource._get_read_options`, adding the hive partition columns of
+    `pattern_fields`.
+    """
+    if row_groups is None and pattern_fields is None:
+        return _read_parquet_file(fs, path, options)
+    import pyarrow.parquet as pq
+
+    with fs.open(path, "rb") as f:
+        pf = pq.ParquetFile(f)
+        if row_groups is None:
+            row_groups = range(pf.num_row_groups)
+        table = pf.read_row_groups(
+            row_groups,
+            columns=_file_columns(options["read_columns"], pattern_fields),
+            use_pandas_metadata=True,
+        )
+    df = _parquet_to_frame(_append_pattern_columns(table, pattern_fields), options)
+    if pattern_fields is None:
+        return df
+    # Filtering out all the rows drops the dictionaries of the partition columns
+    return _add_pattern_columns(
+        df, {field: v for field, v in pattern_fields.items() if field in df}
+    )
+
+
+def _file_columns(columns, pattern_fields):
+    """
+    The `columns` stored in the files, without the hive partition columns.
+    """
+    if columns is None or pattern_fields is None:
+        return columns
+    return [c for c in columns if c not in pattern_fields]
+
+
+def _append_pattern_columns(table, pattern_fields):
+    """
+    Append a dictionary column to a pyarrow Table for each pattern field,
+    given as categories and the value of the file, as pyarrow reads the
+    partition columns of a hive partitioned dataset.
+    """
+    if pattern_fields is None:
+        return table
+    import pyarrow
+
+    for field, (categories, value) in pattern_fields.items():
+        codes = numpy.full(len(table), categories.get_loc(value), dtype="int32")
+        column = pyarrow.DictionaryArray.from_arrays(
+            codes, pyarrow.array(categories.to_numpy())
+        )
+        table = table.append_column(field, column)
+    return table
+
+
+def _hive_values(root, paths):
+    """
+    The values of the ``key=value`` directories of `paths` below `root`, as a
+    frame with a column per key, or None when the paths are not partitioned.
+    Keys whose values are all integers are typed int32, as pyarrow does.
+    """
+    rows = []
+    for path in paths:
+        directories = posixpath.relpath(posixpath.dirname(path), root).split("/")
+        rows.append(
+            dict(unquote(d).split("=", 1) for d in directories if "=" in d)
+        )
+    if not any(rows):
+        return None
+    values = pandas.DataFrame(rows)
+    for key, column in values.items():
+        if column.str.fullmatch(r"-?\d+").all():
+            values[key] = column.astype("int32")
+    return values
+
+
+def _read_parquet_file(fs, path, options):
+    """
+    Read a whole GeoParquet file, with geopandas unless the geometry is ignored
+    or replaced by its bounds.
+    """
+    if options["ignore_geometry"] or options["geometry"] == "bounds":
+        import pyarrow.parquet as pq
+
+        with fs.open(path, "rb") as fobj:
+            table = pq.read_table(
+                fobj,
+                columns=options["columns"],
+                filters=options["filters"],
+                use_pandas_metadata=True,
+            )
+        if options["geometry"] == "bounds":
+            return _arrow_to_bounds(table)
+        return table.to_pandas()
+    with fs.open(path, "rb") as fobj:
+        return geopandas.read_parquet(
+            fobj,
+            columns=options["columns"],
+            filters=options["filters"],
+            **options["geopandas_kwargs"],
+        )
+
+
+def _parquet_to_frame(table, options):
+    """
+    Filter a pyarrow Table of GeoParquet row groups on the `bbox` and
+    `filters` of `options`, and convert it to the output frame.
+    """
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    if options["filters"]:
+        table = table.filter(pq.filters_to_expression(options["filters"]))
+    columns = options["columns"]
+    if options["geometry"] == "bounds":
+        columns = options["attributes"] + _BOUNDS
+    if options["bbox"] is None:
+        if options["geometry"] == "bounds":
+            df = _arrow_to_bounds(table)
+        else:
+            df = _arrow_to_geodataframe(table)
+        return df if columns is None else df[columns]
+    geo = options["geo"]
+    geometry = geo["primary_column"]
+    covering = geo["columns"][geometry].get("covering", {}).get("bbox")
+    (minx, miny, maxx, maxy), mask = options["bbox"]
+    # Drop rows with the covering columns before decoding any geometry
+    if covering is not None:
+        table = table.filter(
+            (ds.field(*covering["xmin"]) <= maxx)
+            & (ds.field(*covering["xmax"]) >= minx)
+            & (ds.field(*covering["ymin"]) <= maxy)
+            & (ds.field(*covering["ymax"]) >= miny)
+        )
+    gdf = _arrow_to_geodataframe(table)
+    gdf = gdf[gdf.intersects(mask)]
+    if options["geometry"] == "bounds":
+        gdf = _bounds_frame(gdf)
+    return gdf if columns is None else gdf[columns]
+
+
+def _bounds_intersect(a, b):
+    return a[0] <= b[2] and a[2] >= b[0] and a[1] <= b[3] and a[3] >= b[1]
+
+
+def _arrow_to_geodataframe(table, **to_pandas_kwargs):
+    """
+    Convert a pyarrow Table with GeoParquet `geo` metadata to a GeoDataFrame,
+    decoding each WKB geometry column in a single vectorized call. A table
+    without any geometry column gives a plain DataFrame.
+    """
+    geo = json.loads(table.schema.metadata[b"geo"])
+    if not any(name in table.column_names for name in geo["columns"]):
+        return table.to_pandas(**to_pandas_kwargs)
+    if any(c.get("encoding", "WKB") != "WKB" for c in geo["columns"].values()):
+        from geopandas.io.arrow import _arrow_to_geopandas
+
+        return _arrow_to_geopandas(table)
+    df = table.to_pandas(**to_pandas_kwargs)
+    for name, column in geo["columns"].items():
+        if name in df:
+            df[name] = geopandas.GeoSeries(
+                _decode_wkb(
+                    df[name].to_numpy(), to_pandas_kwargs.get("use_threads", False)
+                ),
+                index=df.index,
+                crs=column.get("crs", "OGC:CRS84"),
+            )
+    return geopandas.GeoDataFrame(df, geometry=geo["primary_column"])
+
+
+def _arrow_to_bounds(table, **to_pandas_kwargs):
+    """
+    Convert a pyarrow Table with GeoParquet `geo` metadata to a DataFrame with
+    float64 minx, miny, maxx and maxy columns in place of the primary geometry.
+    The bounds are taken from the bbox covering column when it was read, so
+    that no geometry is decoded.
+    """
+    geo = json.loads(table.schema.metadata[b"geo"])
+    geometry = geo["primary_column"]
+    covering = geo["columns"][geometry].get("covering", {}).get("bbox")
+    if covering is None or covering["xmin"][0] not in table.column_names:
+        return _bounds_frame(_arrow_to_geodataframe(table, **to_pandas_kwargs))
+    import pyarrow.compute as pc
+
+    name = covering["xmin"][0]
+    struct = table.column(name)
+    table = table.drop_columns([c for c in (name, geometry) if c in table.column_names])
+    for bound, key in zip(_BOUNDS, ("xmin", "ymin", "xmax", "ymax")):
+        values = pc.struct_field(struct, covering[key][1:]).cast("float64")
+        table = table.append_column(bound, values)
+    return table.to_pandas(**to_pandas_kwargs)
+
+
+def _decode_wkb(values, use_threads=False):
+    """
+    Decode an array of WKB values to shapely geometries, splitting large
+    arrays across threads since shapely releases the GIL.
+    """
+    import shapely
+
+    nthreads = os.cpu_count() or 1
+    if not use_threads or nthreads == 1 or len(values) < 100_000:
+        return shapely.from_wkb(values)
+    with ThreadPoolExecutor(max_workers=nthreads) as pool:
+        chunks = pool.map(shapely.from_wkb, numpy.array_split(values, nthreads))
+        return numpy.concatenate(list(chunks))
+
+
+def _read_parquet_footer(fs, path):
+    import pyarrow.parquet as pq
+
+    with fs.open(path, "rb") as f:
+        return pq.read_metadata(f)
+
+
+def _row_group_bounds(footer, geometry):
+    """
+    Get the bounds of each row group of a parquet file, from the statistics of
+    the GeoParquet bbox covering column if there is one, or else from the
+    file-level bbox in the `geo` metadata. Unknown bounds are None.
+    """
+    column = json.loads(footer.metadata[b"geo"])["columns"][geometry]
+    covering = column.get("covering", {}).get("bbox")
+    bounds = []
+    for i in range(footer.num_row_groups):
+        row_group = footer.row_group(i)
+        stats = {}
+        if covering is not None:
+            for j in range(row_group.num_columns):
+                chunk = row_group.column(j)
+                if chunk.statistics is not None and chunk.statistics.has_min_max:
+                    stats[chunk.path_in_schema] = chunk.statistics
+        try:
+            bounds.append(
+                (
+                    stats[".".join(covering["xmin"])].min,
+                    stats[".".join(covering["ymin"])].min,
+                    stats[".".join(covering["xmax"])].max,
+                    stats[".".join(covering["ymax"])].max,
+                )
+            )
+        except (KeyError, TypeError):
+            bbox = column.get("bbox")
+            if bbox:
+                n = len(bbox) // 2
+                bounds.append((bbox[0], bbox[1], bbox[n], bbox[n + 1]))
+            else:
+                bounds.append(None)
+    return bounds
+
+
+class GeoPandasSQLSource(GeoPandasSource):
+    def __init__(
+        self,
+        uri,
+        sql_expr=None,
+        table=None,
+        geopandas_kwargs=None,
+        metadata=None,
+        ignore_geometry=False,
+        geometry=None,
+        index=None,
+        npartitions=None,
+        boundaries=None,
+        bbox=None,
+        count_rows=False,
+        pool_size=None,
+        pool_recycle=None,
+        engine_kwargs=None,
+        fetch_size=None,
+        cache=False,
+        cache_ttl=None,
+        cache_max_bytes=None,
+        cache_dir=None,
+        watermark_column=None,
+        state_path=None,
+    ):
+        """
+        Parameters
+        ----------
+        uri : str
+            The connection string for the PostGIS database.
+        sql_expr: str, optional
+            The SQL expression used to load from the database.
+            Must include either `sql_expr` or `table`.
+        table: str, optional
+            The table to load from the database.
+            This is ignored if `sql_expr` is provided.
+        geopandas_kwargs : dict
+            Any further arguments of geopandas's read_postgis function, i.e.
+            `geom_col` and `crs`, and those passed on to pandas' read_sql. The
+            geometry column is decoded in a single vectorized call, and the CRS
+            defaults to the SRID of the first EWKB geometry.
+        ignore_geometry : bool
+            Only load the attribute columns with pandas, without decoding the
+            geometry column (`geom_col` in `geopandas_kwargs`, "geom" by
+            default), and return a plain pandas DataFrame.
+        geometry : {None, "bounds"}, optional
+            With ``"bounds"``, return a plain pandas DataFrame where the
+            geometry column is replaced by float64 ``minx``, ``miny``,
+            ``maxx`` and ``maxy`` columns. PostGIS computes them in the
+            database, other sources from the fetched WKB.
+        index : str, optional
+            A column to partition the query on. Each partition is a separate
+            query selecting a range of `index` values, so that partitions can
+            be read in parallel with `to_dask()`.
+        npartitions : int, optional
+            The number of partitions, with boundaries evenly spaced between the
+            minimum and maximum of the numeric or datetime `index`.
+        boundaries : list, optional
+            Explicit `index` values separating the partitions, giving one more
+            partition than values. The first and last partitions are open
+            ended, so that no row is left out.
+        bbox : tuple | GeoDataFrame or GeoSeries, default None
+            Only load the features intersecting this bounding box. CRS
+            mis-matches are resolved if given a GeoSeries or GeoDataFrame.
+            The query is wrapped in a filter the database answers with its
+            spatial index.
+        count_rows : bool
+            Whether `discover()` counts the rows of the query with ``COUNT(*)``.
+            By default, only an estimate from the planner statistics of
+            `table` is reported, as ``estimated_rows`` in the metadata.
+        pool_size : int, optional
+            The size of the connection pool of the SQLAlchemy engine for `uri`.
+        pool_recycle : int, optional
+            The number of seconds after which pooled connections are replaced.
+        engine_kwargs : dict, optional
+            Any further arguments to pass to SQLAlchemy's create_engine.
+            Sources with the same `uri` and engine arguments share one engine
+            and its connection pool in the process, which is disposed of when
+            the last of them is closed.
+        fetch_size : int, optional
+            The number of rows `iter_chunks()` fetches from the server-side
+            cursor at a time. Defaults to the chunk size.
+        cache : bool
+            Whether `read()` keeps its result in a cache shared by the sources
+            of the process, keyed on the normalized `sql_expr`, the `uri` and
+            the reading arguments, so that sources reading the same query do
+            not run it again, nor the queries of `discover()`. Only applies to
+            a `uri` string, without `watermark_column`. Each hit returns a copy
+            of the cached frame.
+        cache_ttl : float, optional
+            The number of seconds a cached result stays valid. By default,
+            results are kept until invalidated or evicted.
+        cache_max_bytes : int, optional
+            The maximum total size of the cached results, in memory and in
+            `cache_dir` each, beyond which the least recently used are evicted.
+        cache_dir : str, optional
+            A local directory where results are also cached as GeoParquet
+            files, to be shared between processes and kept across restarts.
+        watermark_column : str, optional
+            An increasing column, e.g. a serial id or an insertion timestamp,
+            of an append-only query. `read()` then keeps the rows loaded so far
+            and `refresh()` only fetches the rows past the largest value of
+            `watermark_column` read, to append them.
+        state_path : str, optional
+            A local GeoParquet file where the rows read with `watermark_column`
+            are saved after each refresh, and loaded back from by a new source,
+            so that a restart only fetches the rows added since.
+        """
+        _check_geometry(geometry, ignore_geometry)
+        if (npartitions is not None or boundaries is not None) and index is None:
+            raise ValueError("Partitioning needs an index column")
+        if state_path is not None and watermark_column is None:
+            raise ValueError("Saving the state needs a watermark column")
+        self.uri = uri
+        if sql_expr:
+            # The query is wrapped in subqueries, where a semicolon is an error
+            self.sql_expr = sql_expr.rstrip("; \t\r\n")
+        elif table:
+            self.sql_expr = f"SELECT * FROM {table}"
+        else:
+            raise ValueError("Must provide either a sql_expr or a table")
+
+        self._table = table
+        self._geopandas_kwargs = geopandas_kwargs or {}
+        self._ignore_geometry = ignore_geometry
+        self._geometry = geometry
+        self._index = index
+        self._npartitions = npartitions
+        self._boundaries = boundaries
+        self._bbox = bbox
+        self._count_rows = count_rows
+        self._engine_kwargs = dict(engine_kwargs or {})
+        if pool_size is not None:
+            self._engine_kwargs["pool_size"] = pool_size
+        if pool_recycle is not None:
+            self._engine_kwargs["pool_recycle"] = pool_recycle
+        self._engine = None
+        self._fetch_size = fetch_size
+        self._dataframe = None
+        self._partitions = None
+        self._srid = None
+        self._base_sql = None
+        self._cache = cache
+        self._cache_ttl = cache_ttl
+        self._cache_max_bytes = cache_max_bytes
+        self._cache_dir = cache_dir
+        self._watermark_column = watermark_column
+        self._state_path = state_path
+
+        super().__init__(metadata=metadata)
+
+    @property
+    def _geom_col(self):
+        return self._geopandas_kwargs.get("geom_col", "geom")
+
+    def _get_con(self):
+        """
+        The shared SQLAlchemy engine for a `uri` string, or else `uri` itself.
+        """
+        if not isinstance(self.uri, str):
+            return self.uri
+        with _POOLS_LOCK:
+            if self._engine is None:
+                self._engine = _acquire_engine(self.uri, self._engine_kwargs)
+        return self._engine
+
+    @property
+    def _reads_table(self):
+        """
+        Whether the query reads the whole of `table`, rather than a `sql_expr`.
+        """
+        return (
+            self._table is not None
+            and self.sql_expr == f"SELECT * FROM {self._table}"
+        )
+
+    def _read_sql(self, sql, con, chunksize=None):
+        """
+        Run `sql` with pandas, without decoding any geometry.
+        """
+        kwargs = self._get_read_options()["read_kwargs"]
+        return pandas.read_sql(sql, con, chunksize=chunksize, **kwargs)
+
+    def _get_read_options(self):
+        """
+        The arguments of `pandas.read_sql` and `_finish_sql`, so that
+        partitions can be read without the source.
+        """
+        kwargs = dict(self._geopandas_kwargs)
+        kwargs.pop("geom_col", None)
+        crs = kwargs.pop("crs", None)
+        return dict(
+            read_kwargs=kwargs,
+            finish_kwargs=dict(
+                geom_col=self._geom_col,
+                crs=crs,
+                ignore_geometry=self._ignore_geometry,
+                geometry=self._geometry,
+            ),
+        )
+
+    def _bounds_expressions(self, geom_col):
+        """
+        SQL expressions for the minx, miny, maxx and maxy of the quoted
+        `geom_col`, or None to compute them from the fetched WKB instead.
+        """
+        return None
+
+    def _query(self, sql, con):
+        """
+        The query to run for `sql`. An ignored geometry column is left out, so
+        that it is never fetched, and when the database computes bounds, the
+        geometry column is replaced by the bounds expressions.
+        """
+        expressions = None
+        if self._geometry == "bounds":
+            expressions = self._bounds_expressions(_quote(self._geom_col))
+        if not self._ignore_geometry and expressions is None:
+            return sql
+        empty = self._read_sql(f"SELECT * FROM ({sql}) AS q LIMIT 0", con)
+        select = [_quote(c) for c in empty.columns if c != self._geom_col]
+        if self._ignore_geometry and len(select) == len(empty.columns):
+            return sql
+        if expressions is not None:
+            select += [f"{e} AS {name}" for name, e in zip(_BOUNDS, expressions)]
+        return f"SELECT {', '.join(select)} FROM ({sql}) AS q"
+
+    def _finish(self, df):
+        """
+        Turn a frame fetched by `_read_sql` into an output frame.
+        """
+        return _finish_sql(df, **self._get_read_options()["finish_kwargs"])
+
+    def _get_srid(self):
+        """
+        The SRID of the geometry column.
+        """
+        if self._srid is None:
+            geom = _quote(self._geom_col)
+            srid = self._read_sql(
+                f"SELECT ST_SRID({geom}) FROM ({self.sql_expr}) AS q "
+                f"WHERE {geom} IS NOT NULL LIMIT 1",
+                self._get_con(),
+            )
+            srid = srid.iloc[0, 0] if len(srid) else None
+            # NULL for geometries the database cannot read
+            self._srid = 0 if pandas.isna(srid) else int(srid)
+        return self._srid
+
+    def _get_base_sql(self):
+        """
+        The query, restricted to the features intersecting `bbox`.
+        """
+        if self._base_sql is None:
+            if self._bbox is None:
+                self._base_sql = self.sql_expr
+            else:
+                srid = self._get_srid()
+                crs = CRS.from_epsg(srid) if srid else None
+                bounds, _ = _resolve_bbox(self._bbox, crs)
+                self._base_sql = self._bbox_query(
+                    _quote(self._geom_col), [_literal(float(b)) for b in bounds], srid
+                )
+        return self._base_sql
+
+    def _bbox_query(self, geom, bounds, srid):
+        """
+        Wrap the query to select the features whose quoted `geom` intersects
+        `bounds`, given as SQL literals, using the spatial index.
+        """
+        raise NotImplementedError("bbox is not supported by this source")
+
+    def _get_partitions(self):
+        """
+        List the WHERE conditions on `index` selecting each partition, or None
+        for a single partition reading the whole query.
+        """
+        if self._partitions is None:
+            boundaries = self._boundaries
+            if boundaries is None and (self._npartitions or 1) > 1:
+                boundaries = self._auto_boundaries()
+            if not boundaries:
+                self._partitions = [None]
+            else:
+                index = _quote(self._index)
+                values = [_literal(b) for b in boundaries]
+                self._partitions = (
+                    [f"{index} < {values[0]}"]
+                    + [
+                        f"{index} >= {lo} AND {index} < {hi}"
+                        for lo, hi in zip(values[:-1], values[1:])
+                    ]
+                    + [f"{index} >= {values[-1]} OR {index} IS NULL"]
+                )
+        return self._partitions
+
+    def _auto_boundaries(self):
+        """
+        Split the range of `index` into `npartitions` even intervals.
+        """
+        index = _quote(self._index)
+        lo, hi = self._read_sql(
+            f"SELECT MIN({index}), MAX({index}) FROM ({self._get_base_sql()}) AS q",
+            self._get_con(),
+        ).iloc[0]
+        if pandas.isna(lo):
+            return []
+        n = self._npartitions
+        if isinstance(lo, str):
+            # SQLite returns datetimes as text
+            lo, hi = pandas.Timestamp(lo), pandas.Timestamp(hi)
+        if isinstance(lo, pandas.Timestamp):
+            return list(pandas.date_range(lo, hi, periods=n + 1)[1:-1])
+        boundaries = numpy.linspace(lo, hi, n + 1)[1:-1]
+        if numpy.issubdtype(numpy.asarray(lo).dtype, numpy.integer):
+            boundaries = numpy.unique(numpy.ceil(boundaries).astype("int64"))
+        return boundaries.tolist()
+
+    def _get_sql(self, con, partition=None):
+        """
+        The query to read, optionally restricted to the partition `partition`.
+        """
+        sql = self._get_base_sql()
+        if partition is not None:
+            condition = self._get_partitions()[partition]
+            if condition is not None:
+                sql = f"SELECT * FROM ({sql}) AS q WHERE {condition}"
+        return self._query(sql, con)
+
+    def _read(self, con, chunksize=None, partition=None):
+        """
+        Read the query on `con`, as one frame or as an iterator of frames of
+        `chunksize` rows, optionally restricted to the partition `partition`.
+        """
+        sql = self._get_sql(con, partition)
+        dfs = self._read_sql(sql, con, chunksize=chunksize)
+        if chunksize is None:
+            return self._finish(dfs)
+        return map(self._finish, dfs)
+
+    def _open_dataset(self):
+        if self._watermark_column is not None:
+            self.refresh()
+            return
+        key = self._cache_key()
+        if key is None:
+            self._dataframe = self._read(self._get_con())
+            return
+        df = self._get_cached(key)
+        if df is None:
+            with _RESULTS_LOCK:
+                _RESULTS_STATS["misses"] += 1
+            df = self._read(self._get_con())
+            if self._cache_dir is not None:
+                self._write_cache_file(key, df)
+            _cache_put(key, df, time.time(), self._cache_max_bytes)
+        self._dataframe = df.copy()
+
+    def _cache_key(self):
+        """
+        The key of the result in the cache, from the normalized query, the
+        URI and the arguments changing the result, or None without caching.
+        """
+        if (
+            not self._cache
+            or not isinstance(self.uri, str)
+            or self._watermark_column is not None
+        ):
+            return None
+        bbox = self._bbox
+        if isinstance(bbox, (geopandas.GeoSeries, geopandas.GeoDataFrame)):
+            bbox = [bbox.total_bounds.tolist(), bbox.crs and bbox.crs.to_string()]
+        key = [
+            self.uri,
+            " ".join(self.sql_expr.split()),
+            self._geopandas_kwargs,
+            self._ignore_geometry,
+            self._geometry,
+            bbox,
+        ]
+        key = json.dumps(key, sort_keys=True, default=repr)
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def refresh(self):
+        """
+        Fetch the rows past the largest `watermark_column` value read so far,
+        append them to the data and save it to `state_path`. The first refresh
+        reads the whole query, unless a state was saved to `state_path`.
+        Returns the new rows.
+        """
+        if self._watermark_column is None:
+            raise ValueError("Refreshing needs a watermark column")
+        self._load_metadata()
+        if (
+            self._dataframe is None
+            and self._state_path is not None
+            and os.path.exists(self._state_path)
+        ):
+            self._dataframe = self._read_parquet(self._state_path)
+        old = self._dataframe
+        sql = self._get_base_sql()
+        column = _quote(self._watermark_column)
+        if old is not None and old[self._watermark_column].notna().any():
+            watermark = _literal(old[self._watermark_column].max())
+            sql = f"SELECT * FROM ({sql}) AS q WHERE {column} > {watermark}"
+        con = self._get_con()
+        new = self._finish(self._read_sql(self._query(sql, con), con))
+        if old is None:
+            self._dataframe = new
+        elif len(new):
+            self._dataframe = pandas.concat(
+                [old, new], ignore_index="index_col" not in self._geopandas_kwargs
+            )
+        if self._state_path is not None and (old is None or len(new)):
+            _write_parquet(self._dataframe, self._state_path)
+        return new
+
+    def _read_parquet(self, path):
+        """
+        Read a frame saved by the source to a Parquet file.
+        """
+        if self._ignore_geometry or self._geometry == "bounds":
+            return pandas.read_parquet(path)
+        return geopandas.read_parquet(path)
+
+    def _get_cached(self, key):
+        """
+        Get the cached result from memory or `cache_dir`, or None.
+        """
+        df = _cache_get(key, self._cache_ttl)
+        if df is None and self._cache_dir is not None:
+            df = self._read_cache_file(key)
+        return df
+
+    def _read_cache_file(self, key):
+        """
+        Read a valid cached result from `cache_dir` into the memory cache, or
+        return None.
+        """
+        path = os.path.join(self._cache_dir, f"{key}.parquet")
+        try:
+            created = os.path.getmtime(path)
+            if self._cache_ttl is not None and time.time() - created > self._cache_ttl:
+                return None
+            df = self._read_parquet(path)
+        except (OSError, ValueError):
+            # Missing, or removed or replaced while reading
+            return None
+        with _RESULTS_LOCK:
+            _RESULTS_STATS["hits"] += 1
+        _cache_put(key, df, created, self._cache_max_bytes)
+        return df
+
+    def _write_cache_file(self, key, df):
+        """
+        Write a result to `cache_dir`, evicting the least recently written
+        files beyond `cache_max_bytes`.
+        """
+        os.makedirs(self._cache_dir, exist_ok=True)
+        _write_parquet(df, os.path.join(self._cache_dir, f"{key}.parquet"))
+        if self._cache_max_bytes is None:
+            return
+        files = []
+        for entry in os.scandir(self._cache_dir):
+            if entry.name.endswith(".parquet"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, name in sorted(files):
+            if total <= self._cache_max_bytes:
+                break
+            os.remove(name)
+            total -= size
+
+    def invalidate(self):
+        """
+        Drop the cached result of this source from memory and `cache_dir`, so
+        that the next `read()` runs the query again.
+        """
+        self._dataframe = None
+        key = self._cache_key()
+        if key is None:
+            return
+        with _RESULTS_LOCK:
+            _RESULTS.pop(key, None)
+        if self._cache_dir is not None:
+            try:
+                os.remove(os.path.join(self._cache_dir, f"{key}.parquet"))
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def cache_info():
+        """
+        The hits and misses of the result cache shared by the SQL sources, and
+        the number of results and bytes it holds in memory.
+        """
+        with _RESULTS_LOCK:
+            return dict(
+                _RESULTS_STATS,
+                entries=len(_RESULTS),
+                bytes=sum(nbytes for _, nbytes, _ in _RESULTS.values()),
+            )
+
+    def _get_schema(self):
+        key = self._cache_key()
+        if key is not None and self._dataframe is None:
+            df = self._get_cached(key)
+            if df is not None:
+                self._dataframe = df.copy()
+        geometry = None
+        if not self._ignore_geometry and self._geometry is None:
+            geometry = self._geom_col
+        if key is not None and self._dataframe is not None:
+            # Described from the cached result, without querying the data
+            # unless partitions need the range of the index or the extent
+            df = self._dataframe
+            npartitions = len(self._get_partitions())
+            return Schema(
+                datashape=None,
+                dtype={name: str(dtype) for name, dtype in df.dtypes.items()},
+                shape=df.shape,
+                npartitions=npartitions,
+                extra_metadata={"geometry": geometry, "estimated_rows": len(df)},
+            )
+        dtypes = self._get_dtypes()
+        nrows = None
+        if self._count_rows:
+            count = self._read_sql(
+                f"SELECT COUNT(*) FROM ({self._get_base_sql()}) AS q", self._get_con()
+            )
+            nrows = int(count.iloc[0, 0])
+        estimated_rows = None
+        if self._bbox is None:
+            estimated_rows = self._estimate_rows()
+        return Schema(
+            datashape=None,
+            dtype=dtypes,
+            shape=(nrows, len(dtypes)),
+            npartitions=len(self._get_partitions()),
+            extra_metadata={"geometry": geometry, "estimated_rows": estimated_rows},
+        )
+
+    def _get_dtypes(self):
+        """
+        The output dtypes, from the table catalog when reading a whole table,
+        or else from the query.
+        """
+        columns = None
+        if self._reads_table:
+            columns = self._inspect_columns()
+        if columns is None:
+            columns = self._query_dtypes()
+        dtypes = dict(columns)
+        if self._ignore_geometry or self._geometry == "bounds":
+            dtypes.pop(self._geom_col, None)
+            if self._geometry == "bounds":
+                dtypes.update(dict.fromkeys(_BOUNDS, "float64"))
+        elif self._geom_col in dtypes:
+            dtypes[self._geom_col] = "geometry"
+        return dtypes
+
+    def _query_dtypes(self):
+        """
+        The dtypes of the columns of the query, from the type codes of the
+        cursor description of the query run with ``LIMIT 0``. Columns whose
+        type code is not known, e.g. all of them with SQLite, take the dtype
+        pandas gives to their value in the first row.
+        """
+        sql = f"SELECT * FROM ({self.sql_expr}) AS q"
+        with _connect(self._get_con()) as con:
+            if hasattr(con, "exec_driver_sql"):
+                result = con.exec_driver_sql(f"{sql} LIMIT 0")
+                description = result.cursor.description
+                result.close()
+            else:
+                cursor = con.cursor()
+                try:
+                    cursor.execute(f"{sql} LIMIT 0")
+                    description = cursor.description
+                finally:
+                    cursor.close()
+        dtypes = {d[0]: self._type_code_dtype(d[1]) for d in description}
+        unknown = [k for k, v in dtypes.items() if v is None and k != self._geom_col]
+        if unknown:
+            first = self._read_sql(f"{sql} LIMIT 1", self._get_con())
+            for name in unknown:
+                if len(first) and first[name].notna().all():
+                    dtypes[name] = str(first[name].dtype)
+        return {k: v or "object" for k, v in dtypes.items()}
+
+    def _type_code_dtype(self, type_code):
+        """
+        The dtype of a column with the given DB-API type code, or None if it is
+        not known.
+        """
+        return None
+
+    def _inspect_columns(self):
+        """
+        The dtypes of the columns of `table` from the database catalog, or None
+        when the source is not connected through SQLAlchemy.
+        """
+        import datetime
+
+        with _connect(self._get_con()) as con:
+            if not hasattr(con, "dialect"):
+                return None
+            import sqlalchemy
+
+            schema, _, table = self._table.rpartition(".")
+            columns = sqlalchemy.inspect(con).get_columns(table, schema=schema or None)
+        dtypes = {}
+        for column in columns:
+            try:
+                python_type = column["type"].python_type
+            except NotImplementedError:
+                python_type = None
+            dtypes[column["name"]] = {
+                int: "int64",
+                float: "float64",
+                bool: "bool",
+                datetime.datetime: "datetime64[ns]",
+            }.get(python_type, "object")
+        return dtypes
+
+    def _estimate_rows(self):
+        """
+        An estimate of the number of rows from planner statistics, or None.
+        """
+        return None
+
+    def read(self):
+        self._load_metadata()
+        if self._dataframe is None:
+            self._open_dataset()
+        return self._dataframe
+
+    def _read_partition(self, i):
+        return self._read(self._get_con(), partition=i)
+
+    def _get_partition(self, i):
+        if len(self._get_partitions()) == 1:
+            return self.read()
+        return self._read_partition(i)
+
+    def to_dask(self):
+        """
+        Create a lazy dask-geodataframe with one query per partition, so that
+        partitions are read in parallel on the workers.
+        """
+        import dask
+        import dask.dataframe as dd
+        import dask_geopandas  # noqa: F401, registers the geopandas dask backend
+
+        parts = [
+            self._get_partition_task(i) for i in range(len(self._get_partitions()))
+        ]
+        return dd.from_delayed(parts, meta=self._get_meta())
+
+    def _get_partition_task(self, i):
+        """
+        A dask task running the query of partition `i`, resolved here with its
+        WHERE condition, with a module level function, so that workers do not
+        query the boundaries or the extent of the partitions again.
+        """
+        import dask
+
+        return dask.delayed(_read_sql_partition)(
+            self.uri,
+            self._engine_kwargs,
+            self._get_sql(self._get_con(), i),
+            self._get_read_options(),
+        )
+
+    def _get_meta(self):
+        """
+        Build an empty frame matching the partitions, for use as dask `_meta`,
+        from the query run with ``LIMIT 0`` and the schema dtypes, so that no
+        partition is read to build the graph.
+        """
+        self._load_metadata()
+        con = self._get_con()
+        empty = self._read_sql(
+            f"SELECT * FROM ({self._get_sql(con)}) AS q LIMIT 0", con
+        )
+        empty = empty.astype(
+            {
+                name: dtype
+                for name, dtype in self.dtype.items()
+                if name in empty and dtype != "geometry"
+            }
+        )
+        meta = self._finish(empty)
+        if isinstance(meta, geopandas.GeoDataFrame):
+            meta = meta.set_crs(self._get_crs(), allow_override=True)
+        return meta
+
+    def _get_crs(self):
+        """
+        The CRS of the geometry column, from `geopandas_kwargs` or else from
+        the SRID of the first EWKB geometry, as in `_finish`.
+        """
+        crs = self._geopandas_kwargs.get("crs")
+        if crs is None:
+            geom = _quote(self._geom_col)
+            first = self._read_sql(
+                f"SELECT {geom} FROM ({self.sql_expr}) AS q "
+                f"WHERE {geom} IS NOT NULL LIMIT 1",
+                self._get_con(),
+            )
+            srids = shapely.get_srid(_decode_sql_geometry(first.iloc[:, 0].to_numpy()))
+            srids = srids[srids > 0]
+            crs = f"EPSG:{srids[0]}" if len(srids) else None
+        return crs
+
+    def _close(self):
+        super()._close()
+        self._partitions = None
+        self._srid = None
+        self._base_sql = None
+        with _POOLS_LOCK:
+            if self._engine is not None:
+                _release_engine(self.uri, self._engine_kwargs)
+                self._engine = None
+
+    def iter_chunks(self, chunksize=100_000):
+        """
+        Yield the data as frames of at most `chunksize` rows, fetched from a
+        server-side cursor, `fetch_size` rows at a time, where the database
+        driver supports one (e.g. a named cursor with psycopg2). Each chunk's
+        geometries are decoded in one vectorized call, so that client memory
+        is bounded by a chunk rather than the whole result.
+        """
+        fetch_size = self._fetch_size or chunksize
+        with _connect(self._get_con(), yield_per=fetch_size) as con:
+            yield from self._read(con, chunksize=chunksize)
+
+
+# SQLAlchemy engines shared by SQL sources, keyed on URI and engine arguments,
+# with the number of sources using each
+_POOLS = {}
+_POOLS_LOCK = threading.RLock()
+
+
+def _engine_key(uri, engine_kwargs):
+    return uri, json.dumps(engine_kwargs, sort_keys=True, default=repr)
+
+
+def _acquire_engine(uri, engine_kwargs):
+    """
+    Get the shared engine for `uri` and `engine_kwargs`, creating it on first
+    use. Must be called with `_POOLS_LOCK` held.
+    """
+    key = _engine_key(uri, engine_kwargs)
+    if key not in _POOLS:
+        import sqlalchemy
+
+        _POOLS[key] = [sqlalchemy.create_engine(uri, **engine_kwargs), 0]
+    _POOLS[key][1] += 1
+    return _POOLS[key][0]
+
+
+def _release_engine(uri, engine_kwargs):
+    """
+    Release a shared engine, disposing of its pool once no source uses it.
+    Must be called with `_POOLS_LOCK` held.
+    """
+    key = _engine_key(uri, engine_kwargs)
+    _POOLS[key][1] -= 1
+    if _POOLS[key][1] == 0:
+        _POOLS.pop(key)[0].dispose()
+
+
+# Results read by SQL sources with `cache=True`, keyed on `_cache_key()`, as
+# (creation time, size, frame) in least recently used order
+_RESULTS = OrderedDict()
+_RESULTS_LOCK = threading.RLock()
+_RESULTS_STATS = {"hits": 0, "misses": 0}
+
+
+def _cache_get(key, ttl):
+    """
+    Get a cached result no older than `ttl` seconds, or None.
+    """
+    with _RESULTS_LOCK:
+        entry = _RESULTS.get(key)
+        if entry is None:
+            return None
+        if ttl is not None and time.time() - entry[0] > ttl:
+            del _RESULTS[key]
+            return None
+        _RESULTS.move_to_end(key)
+        _RESULTS_STATS["hits"] += 1
+        return entry[2]
+
+
+def _cache_put(key, df, created, max_bytes):
+    """
+    Cache a result, evicting the least recently used beyond `max_bytes`.
+    """
+    nbytes = int(df.memory_usage(deep=True).sum())
+    # Geometries are only counted as pointers, so add their coordinates
+    for _, column in df.select_dtypes("geometry").items():
+        nbytes += int(shapely.get_num_coordinates(column.values).sum()) * 16
+    with _RESULTS_LOCK:
+        _RESULTS.pop(key, None)
+        if max_bytes is not None and nbytes > max_bytes:
+            return
+        _RESULTS[key] = (created, nbytes, df)
+        if max_bytes is not None:
+            total = sum(entry[1] for entry in _RESULTS.values())
+            while total > max_bytes:
+                total -= _RESULTS.popitem(last=False)[1][1]
+
+
+def _write_parquet(df, path):
+    """
+    Write a frame to (Geo)Parquet through a temporary file, so that readers in
+    other processes never see a partial file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        df.to_parquet(tmp)
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+@contextmanager
+def _connect(con, **execution_options):
+    """
+    Open a connection from a SQLAlchemy engine, with the given SQLAlchemy
+    execution options. Other connections are used as they are.
+    """
+    try:
+        from sqlalchemy.engine import Engine
+    except ImportError:
+        Engine = ()
+    if isinstance(con, Engine):
+        with con.connect() as connection:
+            yield connection.execution_options(**execution_options)
+    else:
+        yield con
+
+
+def _read_sql_partition(uri, engine_kwargs, sql, options):
+    """
+    Run the query `sql` of a partition of an SQL source in a dask task, with
+    the options of `GeoPandasSQLSource._get_read_options`.
+    """
+    if not isinstance(uri, str):
+        df = pandas.read_sql(sql, uri, **options["read_kwargs"])
+        return _finish_sql(df, **options["finish_kwargs"])
+    # The engine is shared with the sources of the worker while the task runs
+    with _POOLS_LOCK:
+        con = _acquire_engine(uri, engine_kwargs)
+    try:
+        df = pandas.read_sql(sql, con, **options["read_kwargs"])
+    finally:
+        with _POOLS_LOCK:
+            _release_engine(uri, engine_kwargs)
+    return _finish_sql(df, **options["finish_kwargs"])
+
+
+def _finish_sql(df, geom_col, crs, ignore_geometry, geometry):
+    """
+    Turn a frame fetched from an SQL query into an output frame, decoding the
+    `geom_col` geometries or replacing them by their bounds.
+    """
+    if ignore_geometry:
+        return df.drop(columns=geom_col, errors="ignore")
+    if geometry is None:
+        geoms = _decode_sql_geometry(df[geom_col].to_numpy())
+        if crs is None:
+            # The SRIDs of EWKB headers, as read by GEOS, -1 for nulls
+            srids = shapely.get_srid(geoms)
+            srids = srids[srids > 0]
+            crs = f"EPSG:{srids[0]}" if len(srids) else None
+        df[geom_col] = geopandas.GeoSeries(geoms, index=df.index, crs=crs)
+        return geopandas.GeoDataFrame(df, geometry=geom_col, crs=crs)
+    if geom_col in df:
+        # Bounds computed client side
+        bounds = shapely.bounds(shapely.from_wkb(df.pop(geom_col).to_numpy()))
+        for j, name in enumerate(_BOUNDS):
+            df[name] = bounds[:, j]
+    return df.astype(dict.fromkeys(_BOUNDS, "float64"))
+
+
+def _decode_sql_geometry(values):
+    """
+    Decode a column of WKB or EWKB geometries, as bytes, memoryviews or hex
+    strings, in a single vectorized call.
+    """
+    if pandas.api.types.infer_dtype(values, skipna=True) not in ("bytes", "string"):
+        # e.g. memoryviews of bytea columns from psycopg2
+        values = numpy.array(
+            [bytes(v) if isinstance(v, memoryview) else v for v in values],
+            dtype=object,
+        )
+    return shapely.from_wkb(values)
+
+
+def _quote(name):
+    """
+    Quote an SQL identifier.
+    """
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+def _literal(value):
+    """
+    Render a number, string or datetime as an SQL literal, to inline it in a
+    partition query.
+    """
+    if isinstance(value, (bool, numpy.bool_)):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float, numpy.number)):
+        return repr(value.item() if isinstance(value, numpy.number) else value)
+    if isinstance(value, pandas.Timestamp):
+        value = value.isoformat(sep=" ")
+    return "'{}'".format(str(value).replace("'", "''"))
+
+
+class PostGISSource(GeoPandasSQLSource):
+    name = "postgis"
+
+    def __init__(
+        self,
+        *args,
+        tiles=None,
+        extent=None,
+        spatial_partitions=False,
+        use_arrow=False,
+        **kwargs,
+    ):
+        """
+        A source for a PostGIS query. Takes the same arguments as
+        `GeoPandasSQLSource`, and:
+
+        Parameters
+        ----------
+        tiles : int or (int, int), optional
+            Partition by space on a grid of `tiles` by `tiles`, or ``(nx, ny)``
+            tiles. Each partition queries, using the spatial index, the
+            features whose bounding box has its lower left corner in its tile,
+            so that features spanning several tiles are read once. The outer
+            tiles are open ended.
+        extent : tuple, optional
+            The ``(minx, miny, maxx, maxy)`` covered by the grid, in the CRS of
+            the geometry column. Defaults to the ``ST_EstimatedExtent`` of
+            `table` when reading a whole table, or else to the ``ST_Extent`` of
+            the query.
+        spatial_partitions : bool
+            Whether `to_dask()` sets the `spatial_partitions` of the result to
+            the extent of the features of each tile, so that spatial joins can
+            skip partitions. Computing them scans the geometries of the whole
+            query when the graph is built.
+        use_arrow : bool
+            Whether `read()` and partitions fetch the query as a columnar Arrow
+            table with the ADBC PostgreSQL driver, which uses binary ``COPY``,
+            instead of row by row through the DB-API. Requires
+            `adbc-driver-postgresql`, and a `uri` string or engine. Query
+            `params` are not supported.
+        """
+        super().__init__(*args, **kwargs)
+        if tiles is not None and self._index is not None:
+            raise ValueError("tiles cannot be combined with index partitioning")
+        if isinstance(tiles, int):
+            tiles = (tiles, tiles)
+        self._tiles = tiles
+        self._extent = extent
+        self._spatial_partitions = spatial_partitions
+        self._use_arrow = use_arrow
+        self._tile_bounds = None
+
+    def _read(self, con, chunksize=None, partition=None):
+        if not self._use_arrow or chunksize is not None:
+            return super()._read(con, chunksize=chunksize, partition=partition)
+        table = self._read_arrow(self._get_sql(con, partition))
+        return self._finish(table.to_pandas(split_blocks=True, self_destruct=True))
+
+    def _read_arrow(self, sql):
+        """
+        Fetch the result of `sql` as a pyarrow Table with ADBC. PostGIS
+        geometries arrive as EWKB binary columns.
+        """
+        return _read_adbc(self.uri, sql)
+
+    def _get_partition_task(self, i):
+        if not self._use_arrow:
+            return super()._get_partition_task(i)
+        import dask
+
+        return dask.delayed(_read_arrow_partition)(
+            self.uri, self._get_sql(self._get_con(), i), self._get_read_options()
+        )
+
+    def _bounds_expressions(self, geom_col):
+        return [f"ST_{fn}({geom_col})" for fn in ("XMin", "YMin", "XMax", "YMax")]
+
+    def _type_code_dtype(self, type_code):
+        return _POSTGRES_DTYPES.get(type_code)
+
+    def _estimate_rows(self):
+        if not self._reads_table:
+            return None
+        estimate = self._read_sql(
+            f"SELECT reltuples FROM pg_class "
+            f"WHERE oid = to_regclass({_literal(self._table)})",
+            self._get_con(),
+        )
+        # Tables never analyzed have no estimate, or -1 since PostgreSQL 14
+        if len(estimate) == 0 or estimate.iloc[0, 0] < 0:
+            return None
+        return int(estimate.iloc[0, 0])
+
+    def _bbox_query(self, geom, bounds, srid):
+        envelope = f"ST_MakeEnvelope({', '.join(bounds)}, {srid})"
+        # && is answered by the GiST index, ST_Intersects is exact
+        return (
+            f"SELECT * FROM ({self.sql_expr}) AS q "
+            f"WHERE {geom} && {envelope} AND ST_Intersects({geom}, {envelope})"
+        )
+
+    def _get_partitions(self):
+        """
+        List the WHERE conditions selecting each partition, one per tile of
+        the grid when partitioning by space.
+        """
+        if self._tiles is None:
+            return super()._get_partitions()
+        if self._partitions is None:
+            nx, ny = self._tiles
+            minx, miny, maxx, maxy = self._get_extent()
+            xs = numpy.linspace(minx, maxx, nx + 1)
+            ys = numpy.linspace(miny, maxy, ny + 1)
+            geom = _quote(self._geom_col)
+            srid = self._get_srid()
+            self._partitions = []
+            self._tile_bounds = []
+            for j in range(ny):
+                for i in range(nx):
+                    self._partitions.append(_tile_condition(geom, srid, xs, ys, i, j))
+                    self._tile_bounds.append((xs[i], ys[j], xs[i + 1], ys[j + 1]))
+        return self._partitions
+
+    def _get_extent(self):
+        """
+        The extent covered by the grid of tiles.
+        """
+        if self._extent is not None:
+            return tuple(self._extent)
+        select = "SELECT ST_XMin(e), ST_YMin(e), ST_XMax(e), ST_YMax(e)"
+        if self._reads_table:
+            schema, _, table = self._table.rpartition(".")
+            args = [schema] if schema else []
+            args = ", ".join(_literal(a) for a in args + [table, self._geom_col])
+            extent = self._read_sql(
+                f"{select} FROM (SELECT ST_EstimatedExtent({args}) AS e) AS q",
+                self._get_con(),
+            ).iloc[0]
+            # No estimate without planner statistics
+            if extent.notna().all():
+                return tuple(extent)
+        geom = _quote(self._geom_col)
+        extent = self._read_sql(
+            f"{select} FROM (SELECT ST_Extent({geom}) AS e "
+            f"FROM ({self._get_base_sql()}) AS q) AS q",
+            self._get_con(),
+        ).iloc[0]
+        if extent.isna().any():
+            return (0.0, 0.0, 0.0, 0.0)
+        return tuple(extent)
+
+    def _get_spatial_partitions(self, crs):
+        """
+        The extent of the features of each tile, in a single query, or the
+        tile itself for empty tiles.
+        """
+        geom = _quote(self._geom_col)
+        sql = " UNION ALL ".join(
+            f"SELECT {k} AS k, ST_XMin(e) AS minx, ST_YMin(e) AS miny, "
+            f"ST_XMax(e) AS maxx, ST_YMax(e) AS maxy "
+            f"FROM (SELECT ST_Extent({geom}) AS e FROM ({self._get_base_sql()}) AS q "
+            f"WHERE {condition}) AS q{k}"
+            for k, condition in enumerate(self._get_partitions())
+        )
+        extents = self._read_sql(sql, self._get_con()).set_index("k").sort_index()
+        boxes = [
+            box(*tile) if row.isna().any() else box(*row)
+            for tile, (_, row) in zip(self._tile_bounds, extents.iterrows())
+        ]
+        return geopandas.GeoSeries(boxes, crs=crs)
+
+    def to_dask(self):
+        ddf = super().to_dask()
+        if (
+            self._tiles is not None
+            and self._spatial_partitions
+            and isinstance(ddf._meta, geopandas.GeoDataFrame)
+        ):
+            ddf.spatial_partitions = self._get_spatial_partitions(ddf.crs)
+        return ddf
+
+    def _close(self):
+        super()._close()
+        self._tile_bounds = None
+
+
+# Beyond any real coordinate, for envelopes of open ended tiles
+_FAR = 1e30
+
+# The dtypes pandas gives to PostgreSQL types, by type OID as reported in the
+# cursor description by psycopg
+_POSTGRES_DTYPES = {
+    16: "bool",
+    20: "int64",
+    21: "int64",
+    23: "int64",
+    25: "object",
+    700: "float64",
+    701: "float64",
+    1042: "object",
+    1043: "object",
+}
+
+
+def _read_adbc(uri, sql):
+    """
+    Fetch the result of `sql` as a pyarrow Table with the ADBC PostgreSQL
+    driver, from an SQLAlchemy URI or engine.
+    """
+    import adbc_driver_postgresql.dbapi
+    from sqlalchemy.engine import make_url
+
+    url = uri if isinstance(uri, str) else uri.url
+    # ADBC takes plain libpq URIs, without an SQLAlchemy driver name
+    url = make_url(url).set(drivername="postgresql")
+    with adbc_driver_postgresql.dbapi.connect(
+        url.render_as_string(hide_password=False)
+    ) as con:
+        with con.cursor() as cursor:
+            cursor.execute(sql)
+            return cursor.fetch_arrow_table()
+
+
+def _read_arrow_partition(uri, sql, options):
+    """
+    Fetch the query `sql` of a partition of a PostGIS source with ADBC in a
+    dask task.
+    """
+    df = _read_adbc(uri, sql).to_pandas(split_blocks=True, self_destruct=True)
+    return _finish_sql(df, **options["finish_kwargs"])
+
+
+def _tile_condition(geom, srid, xs, ys, i, j):
+    """
+    The WHERE condition selecting the features whose bounding box has its
+    lower left corner in tile ``(i, j)`` of the grid with edges `xs` and `ys`.
+    The outer edges of the grid are open, and the last tile also takes NULL
+    and empty geometries, which have no bounding box.
+    """
+    nx, ny = len(xs) - 1, len(ys) - 1
+    envelope = [
+        xs[i] if i > 0 else -_FAR,
+        ys[j] if j > 0 else -_FAR,
+        xs[i + 1] if i < nx - 1 else _FAR,
+        ys[j + 1] if j < ny - 1 else _FAR,
+    ]
+    envelope = ", ".join(_literal(v) for v in envelope)
+    # The && test uses the spatial index, the corner tests deduplicate
+    conditions = [f"{geom} && ST_MakeEnvelope({envelope}, {srid})"]
+    if i > 0:
+        conditions.append(f"ST_XMin({geom}) >= {_literal(xs[i])}")
+    if i < nx - 1:
+        conditions.append(f"ST_XMin({geom}) < {_literal(xs[i + 1])}")
+    if j > 0:
+        conditions.append(f"ST_YMin({geom}) >= {_literal(ys[j])}")
+    if j < ny - 1:
+        conditions.append(f"ST_YMin({geom}) < {_literal(ys[j + 1])}")
+    condition = " AND ".join(conditions)
+    if i == nx - 1 and j == ny - 1:
+        condition = f"({condition}) OR {geom} IS NULL OR ST_IsEmpty({geom})"
+    return condition
+
+
+class SpatiaLiteSource(GeoPandasSQLSource):
+    name = "spatialite"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if self._bbox is not None and not self._reads_table:
+            # Queries return WKB, which SpatiaLite functions cannot read
+            raise ValueError(
+                "bbox needs a SpatiaLite table, whose native geometries are "
+                "filtered with its spatial index"
+            )
+
+    def _bbox_query(self, geom, bounds, srid):
+        mbr = f"BuildMbr({', '.join(bounds)}, {srid})"
+        # The native geometries are filtered, then selected as EWKB
+        empty = self._read_sql(f"SELECT * FROM {self._table} LIMIT 0", self._get_con())
+        select = [
+            f"AsEWKB({geom}) AS {geom}" if c == self._geom_col else _quote(c)
+            for c in empty.columns
+        ]
+        index = (
+            f"SELECT ROWID FROM SpatialIndex "
+            f"WHERE f_table_name = {_literal(self._table)} "
+            f"AND f_geometry_column = {_literal(self._geom_col)} "
+            f"AND search_frame = {mbr}"
+        )
+        return (
+            f"SELECT {', '.join(select)} FROM {self._table} "
+            f"WHERE ROWID IN ({index}) AND ST_Intersects({geom}, {mbr})"
+        )
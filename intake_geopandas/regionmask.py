@@ -15,6 +15,7 @@ class RegionmaskSource(GeoPandasFileSource):
         geopandas_kwargs=None,
         metadata=None,
         regionmask_kwargs=None,
+        engine=None,
     ):
         """
         urlpath : str or iterable, location of data
@@ -40,6 +41,9 @@ class RegionmaskSource(GeoPandasFileSource):
             Any further arguments to pass to geopandas's read_file function.
         regionmask_kwargs : dict
             Any further arguments to pass to regionmask.from_geopandas.
+        engine : {"fiona", "pyogrio", "pyogrio+arrow"}, optional
+            The library used to read files. By default, the fastest installed
+            engine is used.
         """
         self._regionmask_kwargs = regionmask_kwargs or {}
 
@@ -50,6 +54,7 @@ class RegionmaskSource(GeoPandasFileSource):
             storage_options=storage_options,
             geopandas_kwargs=geopandas_kwargs,
             bbox=bbox,
+            engine=engine,
         )
 
     def _open_dataset(self):
@@ -58,21 +63,19 @@ class RegionmaskSource(GeoPandasFileSource):
         except ImportError:
             raise ImportError('please install regionmask')
         super()._open_dataset()
-        self._dtypes = self._dataframe.dtypes.to_dict()
-        self._dtypes = {n: str(t) for (n, t) in self._dtypes.items()}
         self._dataframe = regionmask.from_geopandas(
             self._dataframe, **self._regionmask_kwargs
         )
 
     def _get_schema(self):
-
-        if self._dataframe is None:
-            self._open_dataset()
-
+        schema = super()._get_schema()
         return Schema(
             datashape=None,
-            dtype=self._dtypes,
-            shape=(None, len(self._dtypes)),
+            dtype=schema.dtype,
+            shape=schema.shape,
             npartitions=1,
-            extra_metadata={},
+            extra_metadata=schema.extra_metadata,
         )
+
+    def _get_partition(self, i):
+        return self.read()
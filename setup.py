@@ -31,14 +31,13 @@ setup(
     },
     classifiers=[
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.6",
-        "Programming Language :: Python :: 3.7",
-        "Programming Language :: Python :: 3.8",
+        "Programming Language :: Python :: 3.10",
+        "Programming Language :: Python :: 3.11",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.10",
     include_package_data=True,
     install_requires=requires,
-    extras_require={"arrow": ["pyarrow"], "regionmask":["regionmask"]},
+    extras_require={"arrow": ["pyarrow>=14.0"], "regionmask":["regionmask"]},
     long_description_content_type='text/markdown',
     long_description=open('README.md').read(),
     zip_safe=False,
@@ -65,6 +65,27 @@ def test_shape_datasource(shape_datasource):
     }
 
 
+@pytest.mark.parametrize("use_fsspec", [True, False])
+@pytest.mark.parametrize("urlpath", ["*/stations.*", "{site}/stations.{ext}"])
+def test_shapefile_sidecar_glob(tmp_path, shape_filenames, urlpath, use_fsspec):
+    import shutil
+
+    stations = os.path.dirname(shape_filenames["stations"])
+    for site in ["a", "b"]:
+        shutil.copytree(stations, tmp_path / site)
+    datasource = ShapefileSource(str(tmp_path / urlpath), use_fsspec=use_fsspec)
+    expected = ShapefileSource(shape_filenames["stations"]).read()
+    assert datasource.discover()["npartitions"] == 2
+    gdf = datasource.read()
+    assert len(gdf) == 2 * len(expected)
+    if "site" in gdf:
+        assert gdf["site"].value_counts().to_dict() == {
+            "a": len(expected),
+            "b": len(expected),
+        }
+        assert gdf["ext"].unique().tolist() == ["shp"]
+
+
 def test_geojson_datasource(geojson_datasource):
     info = geojson_datasource.discover()
     geojson_datasource.read()
@@ -102,3 +123,643 @@ def test_geoparquet_to_dask(geoparquet_filename, use_fsspec):
     dgdf = datasource.to_dask()
     gdf = dgdf.compute()
     assert isinstance(gdf, GeoDataFrame)
+
+
+@pytest.fixture
+def geojson_parts(tmp_path, geojson_filenames):
+    gdf = GeoJSONSource(geojson_filenames["countries"]).read()
+    for i, start in enumerate(range(0, len(gdf), 60)):
+        gdf.iloc[start : start + 60].to_file(
+            tmp_path / f"countries_{i}.geo.json", driver="GeoJSON"
+        )
+    return str(tmp_path / "countries_*.geo.json"), len(gdf)
+
+
+@pytest.mark.parametrize("use_fsspec", [True, False])
+def test_glob_partitions(geojson_parts, use_fsspec):
+    urlpath, nrows = geojson_parts
+    datasource = GeoJSONSource(urlpath, use_fsspec=use_fsspec)
+    info = datasource.discover()
+    assert info["npartitions"] == 3
+    assert [len(datasource.read_partition(i)) for i in range(3)] == [60, 60, 60]
+    gdf = datasource.read()
+    assert isinstance(gdf, GeoDataFrame)
+    assert len(gdf) == nrows
+    assert gdf.index.is_unique
+
+
+@pytest.fixture
+def geojson_pattern(tmp_path, geojson_filenames):
+    gdf = GeoJSONSource(geojson_filenames["countries"]).read()
+    for i, (region, year) in enumerate([("east", 2019), ("east", 2020), ("west", 2021)]):
+        (tmp_path / region / str(year)).mkdir(parents=True)
+        gdf.iloc[i * 60 : (i + 1) * 60].to_file(
+            tmp_path / region / str(year) / "countries.geo.json", driver="GeoJSON"
+        )
+    return str(tmp_path / "{region}" / "{year:d}" / "countries.geo.json")
+
+
+@pytest.mark.parametrize("use_fsspec", [True, False])
+def test_pattern_columns(geojson_pattern, use_fsspec):
+    datasource = GeoJSONSource(geojson_pattern, use_fsspec=use_fsspec)
+    info = datasource.discover()
+    assert info["npartitions"] == 3
+    assert info["dtype"]["region"] == "category"
+    gdf = datasource.read()
+    assert gdf["region"].dtype == "category"
+    assert gdf["region"].value_counts().to_dict() == {"east": 120, "west": 60}
+    assert sorted(gdf["year"].unique()) == [2019, 2020, 2021]
+
+
+def test_pattern_values_as_parsed(tmp_path, geojson_filenames):
+    gdf = GeoJSONSource(geojson_filenames["countries"]).read()
+    for i, zipcode in enumerate(["02134", "10001"]):
+        gdf.iloc[i * 10 : (i + 1) * 10].to_file(
+            tmp_path / f"zip_{zipcode}.geo.json", driver="GeoJSON"
+        )
+    datasource = GeoJSONSource(
+        str(tmp_path / "zip_{zipcode}.geo.json"), pattern_filter="zipcode < '1'"
+    )
+    gdf = datasource.read()
+    assert len(gdf) == 10
+    assert gdf["zipcode"].unique().tolist() == ["02134"]
+
+
+def test_pattern_filter(geojson_pattern):
+    datasource = GeoJSONSource(geojson_pattern, pattern_filter="year >= 2020")
+    assert datasource.discover()["npartitions"] == 2
+    gdf = datasource.read()
+    assert sorted(gdf["year"].unique()) == [2020, 2021]
+    assert len(gdf) == 120
+
+
+@pytest.mark.parametrize("use_fsspec", [True, False])
+def test_chunksize_partitions(gpkg_filename, use_fsspec):
+    datasource = GeoPandasFileSource(
+        gpkg_filename, use_fsspec=use_fsspec, chunksize=50
+    )
+    info = datasource.discover()
+    assert info["npartitions"] == 4
+    lengths = [len(datasource.read_partition(i)) for i in range(4)]
+    assert lengths == [50, 50, 50, 30]
+    gdf = datasource.read()
+    assert len(gdf) == 180
+    assert gdf["name"].tolist() == GeoPandasFileSource(gpkg_filename).read()[
+        "name"
+    ].tolist()
+
+
+def test_to_dask_file_partitions(geojson_pattern):
+    dask_geopandas = pytest.importorskip("dask_geopandas")
+    datasource = GeoJSONSource(geojson_pattern)
+    dgdf = datasource.to_dask()
+    assert isinstance(dgdf, dask_geopandas.GeoDataFrame)
+    assert dgdf.npartitions == 3
+    assert dgdf.crs == "EPSG:4326"
+    gdf = dgdf.compute()
+    assert isinstance(gdf, GeoDataFrame)
+    assert len(gdf) == 180
+    assert gdf["region"].dtype == "category"
+
+
+def test_to_dask_chunksize(gpkg_filename):
+    pytest.importorskip("dask_geopandas")
+    datasource = GeoPandasFileSource(gpkg_filename, chunksize=100)
+    dgdf = datasource.to_dask()
+    assert dgdf.npartitions == 2
+    assert len(dgdf.compute()) == 180
+
+
+@pytest.mark.parametrize("source", ["pattern", "chunksize", "geoparquet"])
+def test_to_dask_tasks_without_source(source, request, monkeypatch):
+    import pickle
+
+    pytest.importorskip("dask_geopandas")
+    if source == "pattern":
+        datasource = GeoJSONSource(request.getfixturevalue("geojson_pattern"))
+    elif source == "chunksize":
+        datasource = GeoPandasFileSource(
+            request.getfixturevalue("gpkg_filename"), chunksize=100
+        )
+    else:
+        datasource = GeoParquetSource(
+            request.getfixturevalue("geoparquet_dir"), bbox=(0, 0, 20, 20)
+        )
+    expected = datasource.read()
+    dgdf = datasource.to_dask()
+
+    # Unpickling a source re-runs __init__, the tasks must not carry one
+    def fail(self, *args, **kwargs):
+        raise AssertionError("source rebuilt in a task")
+
+    monkeypatch.setattr(type(datasource), "__init__", fail)
+    monkeypatch.setattr(type(datasource), "_get_files", fail)
+    gdf = pickle.loads(pickle.dumps(dgdf)).compute()
+    assert len(gdf) == len(expected)
+    assert sorted(gdf["name"]) == sorted(expected["name"])
+
+
+@pytest.fixture(params=["GPKG", "GeoJSON"])
+def typed_layer(request, tmp_path):
+    import datetime
+
+    fiona = pytest.importorskip("fiona")
+    path = str(tmp_path / f"typed.{request.param.lower()}")
+    schema = {
+        "geometry": "Point",
+        "properties": {
+            "small": "int32",
+            "big": "int64",
+            "day": "date",
+            "time": "datetime",
+            "name": "str",
+        },
+    }
+    with fiona.open(
+        path, "w", driver=request.param, schema=schema, crs="EPSG:4326"
+    ) as collection:
+        for i in range(5):
+            collection.write(
+                {
+                    "geometry": {"type": "Point", "coordinates": (i, i)},
+                    "properties": {
+                        "small": i,
+                        "big": i,
+                        "day": datetime.date(2020, 1, i + 1),
+                        "time": datetime.datetime(2020, 1, 1, i),
+                        "name": f"p{i}",
+                    },
+                }
+            )
+    return path
+
+
+@pytest.mark.parametrize("engine", ["fiona", "pyogrio", "pyogrio+arrow"])
+def test_discover_dtypes_match_read(typed_layer, engine):
+    pytest.importorskip(engine.split("+")[0])
+    if engine.endswith("+arrow"):
+        pytest.importorskip("pyarrow")
+    datasource = GeoPandasFileSource(typed_layer, engine=engine, chunksize=2)
+    dtypes = datasource.discover()["dtype"]
+    gdf = datasource.read()
+    assert dtypes == {name: str(dtype) for name, dtype in gdf.dtypes.items()}
+
+
+@pytest.mark.parametrize("engine", ["fiona", "pyogrio", "pyogrio+arrow"])
+def test_to_dask_typed_fields(typed_layer, engine):
+    pytest.importorskip("dask_geopandas")
+    pytest.importorskip(engine.split("+")[0])
+    if engine.endswith("+arrow"):
+        pytest.importorskip("pyarrow")
+    datasource = GeoPandasFileSource(typed_layer, engine=engine, chunksize=2)
+    meta = datasource._get_meta()
+    assert dict(meta.dtypes) == dict(datasource.read_partition(0).dtypes)
+    dgdf = datasource.to_dask()
+    assert dgdf.npartitions == 3
+    # Computing checks each partition against the meta
+    assert len(dgdf.compute()) == 5
+
+
+def test_discover_from_layer_metadata(gpkg_filename, monkeypatch):
+    import geopandas
+
+    def fail(*args, **kwargs):
+        raise AssertionError("discover() must not read features")
+
+    datasource = GeoPandasFileSource(gpkg_filename)
+    monkeypatch.setattr(geopandas, "read_file", fail)
+    info = datasource.discover()
+    monkeypatch.undo()
+    assert info["shape"] == (180, 3)
+    assert info["dtype"] == {"id": "object", "name": "object", "geometry": "geometry"}
+    assert info["metadata"]["crs"] == "EPSG:4326"
+    assert info["metadata"]["total_bounds"] == pytest.approx(
+        (-180.0, -85.609038, 180.0, 83.64513)
+    )
+    assert len(datasource.read()) == 180
+
+
+@pytest.fixture
+def geoparquet_dir(tmp_path, geoparquet_filename):
+    import geopandas
+
+    gdf = geopandas.read_parquet(geoparquet_filename)
+    gdf = gdf.iloc[gdf.geometry.bounds["maxx"].argsort()].reset_index(drop=True)
+    for i in range(3):
+        gdf.iloc[i * 60 : (i + 1) * 60].to_parquet(
+            tmp_path / f"part.{i}.parquet", row_group_size=30, write_covering_bbox=True
+        )
+    return str(tmp_path)
+
+
+def test_geoparquet_discover_footers(geoparquet_filename, monkeypatch):
+    import dask_geopandas
+    import geopandas
+
+    def fail(*args, **kwargs):
+        raise AssertionError("discover() must only read footers")
+
+    monkeypatch.setattr(geopandas, "read_parquet", fail)
+    monkeypatch.setattr(dask_geopandas, "read_parquet", fail)
+    info = GeoParquetSource(geoparquet_filename).discover()
+    assert info["shape"] == (180, 3)
+    assert info["npartitions"] == 1
+    assert info["dtype"]["geometry"] == "geometry"
+    assert info["metadata"]["crs"] == "EPSG:4326"
+    assert info["metadata"]["total_bounds"] == pytest.approx(
+        (-180.0, -85.609038, 180.0, 83.64513)
+    )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"where": "year = 2020"},
+        {"chunksize": 10},
+        {"engine": "pyogrio"},
+        {"pattern_filter": "year >= 2020"},
+    ],
+    ids=["where", "chunksize", "engine", "pattern_filter"],
+)
+def test_geoparquet_unsupported_arguments(geoparquet_filename, kwargs):
+    with pytest.raises(ValueError, match=next(iter(kwargs))):
+        GeoParquetSource(geoparquet_filename, **kwargs)
+
+
+def test_geoparquet_row_group_bounds(geoparquet_dir):
+    datasource = GeoParquetSource(geoparquet_dir)
+    info = datasource.discover()
+    assert info["npartitions"] == 3
+    assert info["shape"][0] == 180
+    assert len(info["metadata"]["row_group_bounds"]) == 6
+    dgdf = datasource.to_dask()
+    assert dgdf.npartitions == 3
+    gdf = dgdf.compute()
+    for bounds, start in zip(info["metadata"]["row_group_bounds"], range(0, 180, 30)):
+        assert tuple(gdf.iloc[start : start + 30].total_bounds) == pytest.approx(bounds)
+
+
+@pytest.mark.parametrize(
+    "bbox", [(0, 0, 20, 20), "geoseries"], ids=["tuple", "geoseries"]
+)
+def test_geoparquet_bbox(geoparquet_dir, bbox):
+    import geopandas
+    from shapely.geometry import box
+
+    if bbox == "geoseries":
+        bbox = geopandas.GeoSeries([box(0, 0, 20, 20)], crs="EPSG:4326").to_crs(3857)
+    expected = geopandas.read_parquet(geoparquet_dir)
+    expected = expected[expected.intersects(box(0, 0, 20, 20))]
+
+    datasource = GeoParquetSource(geoparquet_dir, bbox=bbox)
+    info = datasource.discover()
+    row_groups = sum(len(rg) for _, rg in datasource._get_partitions())
+    assert row_groups < len(info["metadata"]["row_group_bounds"])
+    gdf = datasource.read()
+    assert isinstance(gdf, GeoDataFrame)
+    assert sorted(gdf["name"]) == sorted(expected["name"])
+    assert sorted(datasource.to_dask().compute()["name"]) == sorted(expected["name"])
+
+
+def test_geoparquet_bbox_no_match(geoparquet_dir):
+    datasource = GeoParquetSource(geoparquet_dir, bbox=(1000, 1000, 1001, 1001))
+    assert datasource.discover()["npartitions"] == 0
+    assert len(datasource.read()) == 0
+    assert len(datasource.to_dask().compute()) == 0
+
+
+@pytest.mark.parametrize("bbox", [None, (-180, -90, 180, 90)])
+def test_geoparquet_columns_filters(geoparquet_dir, bbox):
+    datasource = GeoParquetSource(
+        geoparquet_dir, columns=["name"], filters=[["id", "<", "C"]], bbox=bbox
+    )
+    info = datasource.discover()
+    assert info["dtype"] == {"name": "object", "geometry": "geometry"}
+    gdf = datasource.read()
+    assert list(gdf.columns) == ["name", "geometry"]
+    assert len(gdf) > 0
+    expected = GeoParquetSource(geoparquet_dir).read()
+    expected = expected[expected["id"] < "C"]
+    assert sorted(gdf["name"]) == sorted(expected["name"])
+    dgdf = datasource.to_dask()
+    assert list(dgdf.columns) == ["name", "geometry"]
+    assert sorted(dgdf.compute()["name"]) == sorted(expected["name"])
+
+
+@pytest.mark.parametrize("memory_pool", [None, "system"])
+def test_geoparquet_read_without_dask(geoparquet_dir, monkeypatch, memory_pool):
+    import dask_geopandas
+
+    def fail(*args, **kwargs):
+        raise AssertionError("read() must not build a dask graph")
+
+    monkeypatch.setattr(dask_geopandas, "read_parquet", fail)
+    datasource = GeoParquetSource(
+        geoparquet_dir, use_threads=True, memory_pool=memory_pool
+    )
+    gdf = datasource.read()
+    assert isinstance(gdf, GeoDataFrame)
+    assert len(gdf) == 180
+    assert gdf.crs == "EPSG:4326"
+    assert datasource.read() is gdf
+
+
+def test_geoparquet_geopandas_kwargs(geoparquet_dir):
+    pytest.importorskip("dask_geopandas")
+    datasource = GeoParquetSource(
+        geoparquet_dir,
+        geopandas_kwargs={"columns": ["name"], "filters": [("id", "==", "FRA")]},
+    )
+    gdf = datasource.read()
+    assert list(gdf.columns) == ["name", "geometry"]
+    assert gdf["name"].tolist() == ["France"]
+    assert list(datasource.to_dask().columns) == ["name", "geometry"]
+
+    # Other arguments go to dask-geopandas, for read() too
+    gdf = GeoParquetSource(geoparquet_dir, geopandas_kwargs={"index": "id"}).read()
+    assert gdf.index.name == "id"
+    assert len(gdf) == 180
+
+    with pytest.raises(ValueError, match="twice"):
+        GeoParquetSource(
+            geoparquet_dir, columns=["id"], geopandas_kwargs={"columns": ["name"]}
+        )
+    with pytest.raises(ValueError, match="bbox"):
+        GeoParquetSource(
+            geoparquet_dir, bbox=(0, 0, 1, 1), geopandas_kwargs={"index": "id"}
+        )
+
+
+@pytest.mark.parametrize("engine", ["fiona", "pyogrio", "pyogrio+arrow"])
+def test_read_engines(shape_filenames, gpkg_filename, engine):
+    pytest.importorskip(engine.split("+")[0])
+    if engine.endswith("+arrow"):
+        pytest.importorskip("pyarrow")
+    datasource = ShapefileSource(shape_filenames["stations"], engine=engine)
+    info = datasource.discover()
+    assert info["shape"] == (86, 5)
+    gdf = datasource.read()
+    assert list(gdf.columns) == list(info["dtype"])
+    assert len(gdf) == 86
+
+    datasource = GeoPandasFileSource(gpkg_filename, engine=engine, chunksize=100)
+    assert len(datasource.read_partition(1)) == 80
+
+
+def test_unknown_engine(shape_filenames):
+    with pytest.raises(ValueError, match="engine"):
+        ShapefileSource(shape_filenames["stations"], engine="gdal")
+
+
+@pytest.mark.parametrize("engine", ["fiona", "pyogrio"])
+def test_columns_where(gpkg_filename, engine):
+    pytest.importorskip(engine)
+    datasource = GeoPandasFileSource(
+        gpkg_filename,
+        engine=engine,
+        columns=["name"],
+        where="id LIKE 'A%'",
+        chunksize=100,
+    )
+    info = datasource.discover()
+    assert info["dtype"] == {"name": "object", "geometry": "geometry"}
+    assert info["shape"] == (None, 2)
+    gdf = datasource.read()
+    assert list(gdf.columns) == ["name", "geometry"]
+    expected = GeoPandasFileSource(gpkg_filename).read()
+    expected = expected[expected["id"].str.startswith("A")]
+    assert sorted(gdf["name"]) == sorted(expected["name"])
+    assert list(datasource.read_partition(0).columns) == ["name", "geometry"]
+
+
+@pytest.mark.parametrize("engine", ["fiona", "pyogrio", "pyogrio+arrow"])
+def test_ignore_geometry(shape_filenames, engine):
+    pytest.importorskip(engine.split("+")[0])
+    datasource = ShapefileSource(
+        shape_filenames["stations"], engine=engine, ignore_geometry=True
+    )
+    info = datasource.discover()
+    assert "geometry" not in info["dtype"]
+    assert info["metadata"]["geometry"] is None
+    df = datasource.read()
+    assert not isinstance(df, GeoDataFrame)
+    assert list(df.columns) == list(info["dtype"])
+    assert len(df) == 86
+    ddf = datasource.to_dask()
+    assert not isinstance(ddf._meta, GeoDataFrame)
+    assert len(ddf.compute()) == 86
+
+
+@pytest.mark.parametrize("bbox", [None, (0, 0, 20, 20)])
+def test_geoparquet_ignore_geometry(geoparquet_dir, bbox):
+    datasource = GeoParquetSource(geoparquet_dir, bbox=bbox, ignore_geometry=True)
+    info = datasource.discover()
+    assert info["dtype"] == {"id": "object", "name": "object"}
+    assert info["metadata"]["geometry"] is None
+    df = datasource.read()
+    assert not isinstance(df, GeoDataFrame)
+    assert list(df.columns) == list(info["dtype"])
+    expected = GeoParquetSource(geoparquet_dir, bbox=bbox).read()
+    assert sorted(df["name"]) == sorted(expected["name"])
+    ddf = datasource.to_dask()
+    assert not isinstance(ddf._meta, GeoDataFrame)
+    assert sorted(ddf.compute()["name"]) == sorted(expected["name"])
+
+
+@pytest.mark.parametrize("engine", ["fiona", "pyogrio", "pyogrio+arrow"])
+def test_bounds(gpkg_filename, engine):
+    pytest.importorskip(engine.split("+")[0])
+    expected = GeoPandasFileSource(gpkg_filename).read()
+    datasource = GeoPandasFileSource(
+        gpkg_filename, engine=engine, geometry="bounds", chunksize=100
+    )
+    info = datasource.discover()
+    assert info["dtype"] == {
+        "id": "object",
+        "name": "object",
+        "minx": "float64",
+        "miny": "float64",
+        "maxx": "float64",
+        "maxy": "float64",
+    }
+    df = datasource.read()
+    assert not isinstance(df, GeoDataFrame)
+    assert list(df.columns) == list(info["dtype"])
+    assert df["name"].tolist() == expected["name"].tolist()
+    assert df[["minx", "miny", "maxx", "maxy"]].to_numpy() == pytest.approx(
+        expected.bounds.to_numpy()
+    )
+    assert len(datasource.to_dask().compute()) == len(expected)
+
+
+@pytest.mark.parametrize("engine", ["fiona", "pyogrio", "pyogrio+arrow"])
+@pytest.mark.parametrize(
+    "kwargs",
+    [dict(where="id LIKE 'A%'"), dict(bbox=(0, 0, 20, 20))],
+    ids=["where", "bbox"],
+)
+def test_bounds_filtered_chunks(gpkg_filename, engine, kwargs):
+    pytest.importorskip(engine.split("+")[0])
+    expected = GeoPandasFileSource(gpkg_filename, engine="pyogrio", **kwargs).read()
+    datasource = GeoPandasFileSource(
+        gpkg_filename, engine=engine, geometry="bounds", chunksize=100, **kwargs
+    )
+    parts = [datasource.read_partition(i) for i in range(2)]
+    assert sum(len(part) for part in parts) == len(expected)
+    df = datasource.read()
+    assert list(df.columns)[-4:] == ["minx", "miny", "maxx", "maxy"]
+    assert df["minx"].dtype == "float64"
+    assert df["name"].tolist() == expected["name"].tolist()
+    chunks = list(datasource.iter_chunks(60))
+    assert sum(len(chunk) for chunk in chunks) == len(expected)
+
+    chunks = list(
+        GeoPandasFileSource(
+            gpkg_filename, engine=engine, geometry="bounds"
+        ).iter_chunks(60)
+    )
+    assert [len(chunk) for chunk in chunks] == [60, 60, 60]
+
+
+def test_bounds_invalid(gpkg_filename):
+    with pytest.raises(ValueError, match="geometry"):
+        GeoPandasFileSource(gpkg_filename, geometry="centroid")
+    with pytest.raises(ValueError, match="ignore_geometry"):
+        GeoPandasFileSource(gpkg_filename, geometry="bounds", ignore_geometry=True)
+
+
+@pytest.mark.parametrize("bbox", [None, (0, 0, 20, 20)])
+@pytest.mark.parametrize("covering", [True, False])
+def test_geoparquet_bounds(geoparquet_dir, tmp_path, bbox, covering):
+    import geopandas
+    from shapely.geometry import box
+
+    urlpath = geoparquet_dir
+    if not covering:
+        urlpath = str(tmp_path / "nocovering.parquet")
+        geopandas.read_parquet(geoparquet_dir).to_parquet(urlpath)
+    expected = geopandas.read_parquet(urlpath)
+    if bbox is not None:
+        expected = expected[expected.intersects(box(*bbox))]
+    datasource = GeoParquetSource(urlpath, bbox=bbox, geometry="bounds")
+    info = datasource.discover()
+    assert list(info["dtype"]) == ["id", "name", "minx", "miny", "maxx", "maxy"]
+    assert info["metadata"]["geometry"] is None
+    for df in (datasource.read(), datasource.to_dask().compute()):
+        assert not isinstance(df, GeoDataFrame)
+        assert list(df.columns) == list(info["dtype"])
+        df = df.sort_values("id")
+        assert df["id"].tolist() == sorted(expected["id"])
+        bounds = expected.sort_values("id").bounds.to_numpy()
+        assert df[["minx", "miny", "maxx", "maxy"]].to_numpy() == pytest.approx(
+            bounds, abs=1e-5
+        )
+
+
+@pytest.mark.parametrize("engine", ["fiona", "pyogrio", "pyogrio+arrow"])
+def test_iter_chunks(geojson_pattern, engine):
+    import pandas
+
+    pytest.importorskip(engine.split("+")[0])
+    datasource = GeoJSONSource(geojson_pattern, engine=engine)
+    expected = datasource.read()
+    chunks = list(datasource.iter_chunks(chunksize=25))
+    assert all(isinstance(chunk, GeoDataFrame) for chunk in chunks)
+    assert max(len(chunk) for chunk in chunks) == 25
+    assert pandas.concat(chunks)["name"].tolist() == expected["name"].tolist()
+
+    datasource = GeoJSONSource(geojson_pattern, engine=engine, where="id LIKE 'A%'")
+    expected = datasource.read()
+    chunks = list(datasource.iter_chunks(chunksize=5))
+    assert pandas.concat(chunks)["name"].tolist() == expected["name"].tolist()
+
+
+@pytest.mark.parametrize("engine", ["fiona", "pyogrio", "pyogrio+arrow"])
+def test_iter_chunks_single_pass(typed_layer, engine, monkeypatch):
+    import geopandas
+    import pandas
+
+    pytest.importorskip(engine.split("+")[0])
+    pytest.importorskip("pyarrow")
+    datasource = GeoPandasFileSource(typed_layer, engine=engine)
+    expected = datasource.read()
+
+    def fail(*args, **kwargs):
+        raise AssertionError("iter_chunks() must not reopen the file per chunk")
+
+    monkeypatch.setattr(geopandas, "read_file", fail)
+    chunks = list(datasource.iter_chunks(chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    df = pandas.concat(chunks, ignore_index=True)
+    assert dict(df.dtypes) == dict(expected.dtypes)
+    assert df["small"].tolist() == expected["small"].tolist()
+
+    datasource = GeoPandasFileSource(
+        typed_layer, engine=engine, columns=["name"], ignore_geometry=True
+    )
+    chunks = list(datasource.iter_chunks(chunksize=4))
+    assert [list(chunk.columns) for chunk in chunks] == [["name"], ["name"]]
+
+
+@pytest.mark.parametrize("bbox", [None, (0, 0, 20, 20)])
+def test_geoparquet_iter_chunks(geoparquet_dir, bbox):
+    import pandas
+
+    datasource = GeoParquetSource(
+        geoparquet_dir, bbox=bbox, columns=["name"], filters=[("id", "<", "S")]
+    )
+    expected = datasource.read()
+    chunks = list(datasource.iter_chunks(chunksize=20))
+    assert all(isinstance(chunk, GeoDataFrame) for chunk in chunks)
+    assert max(len(chunk) for chunk in chunks) <= 20
+    df = pandas.concat(chunks)
+    assert list(df.columns) == ["name", "geometry"]
+    assert sorted(df["name"]) == sorted(expected["name"])
+
+
+@pytest.fixture
+def geoparquet_hive(tmp_path, geoparquet_filename):
+    import geopandas
+
+    gdf = geopandas.read_parquet(geoparquet_filename)
+    gdf = gdf.iloc[gdf.geometry.bounds["maxx"].argsort()].reset_index(drop=True)
+    partitions = [(2019, "east"), (2020, "east"), (2020, "west")]
+    for i, (year, region) in enumerate(partitions):
+        path = tmp_path / "hive" / f"year={year}" / f"region={region}"
+        path.mkdir(parents=True)
+        gdf.iloc[i * 60 : (i + 1) * 60].to_parquet(
+            path / "part.parquet", row_group_size=30, write_covering_bbox=True
+        )
+    return str(tmp_path / "hive")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"bbox": (0, 0, 20, 20)},
+        {"geometry": "bounds"},
+        {"filters": [("year", "=", 2020)], "bbox": (-180, -90, 180, 90)},
+        {"columns": ["name", "region"], "ignore_geometry": True},
+    ],
+    ids=["all", "bbox", "bounds", "filters", "columns"],
+)
+def test_geoparquet_hive_partitions(geoparquet_hive, kwargs):
+    import pandas
+
+    datasource = GeoParquetSource(geoparquet_hive, **kwargs)
+    info = datasource.discover()
+    assert info["dtype"]["region"] == "category"
+    gdf = datasource.read()
+    assert list(gdf.columns) == list(info["dtype"])
+    assert gdf["region"].dtype == "category"
+    for df in [
+        datasource.to_dask().compute(),
+        pandas.concat(datasource.read_partition(i) for i in range(info["npartitions"])),
+        pandas.concat(datasource.iter_chunks(chunksize=20)),
+    ]:
+        assert list(df.columns) == list(gdf.columns)
+        assert sorted(df["region"].astype(str)) == sorted(gdf["region"].astype(str))
+    if "year" in gdf:
+        years = {"filters": [2020]}.get(next(iter(kwargs), None), [2019, 2020])
+        assert sorted(gdf["year"].unique()) == years
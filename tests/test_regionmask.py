@@ -93,3 +93,14 @@ def test_regionmask_yaml_cache():
     assert not os.path.exists(expected_location)
     meow_regions = item.read()
     assert isinstance(meow_regions, regionmask.Regions), print(type(meow_regions))
+
+
+@pytest.mark.skipif(not regionmask_installed, reason='regionmask needs to be installed')
+def test_regionmask_to_dask():
+    pytest.importorskip('dask_geopandas')
+    path = os.path.join(os.path.dirname(__file__), 'data', 'countries.geo.json')
+    item = RegionmaskSource(path, regionmask_kwargs={'names': 'name'})
+    gdf = item.to_dask().compute()
+    assert isinstance(gdf, geopandas.GeoDataFrame)
+    assert len(gdf) == 180
+    assert isinstance(item.read(), regionmask.Regions)
@@ -111,3 +111,57 @@ def test_remote_GeoJSONSource(GeoJSONSource_countries_remote, same_names):
     assert os.path.exists(expected_location_on_disk)
     try_clean_cache(item)
     assert not os.path.exists(expected_location_on_disk)
+
+
+@pytest.fixture
+def counting_http_server():
+    """Serve tests/data/stations over HTTP, counting the GETs of each file."""
+    import collections
+    import functools
+    import http.server
+    import threading
+
+    counts = collections.Counter()
+
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        def do_GET(self):
+            counts[self.path] += 1
+            super().do_GET()
+
+        def log_message(self, *args):
+            pass
+
+    directory = os.path.join(os.path.dirname(__file__), 'data', 'stations')
+    server = http.server.ThreadingHTTPServer(
+        ('127.0.0.1', 0), functools.partial(Handler, directory=directory)
+    )
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{server.server_address[1]}', counts
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize('strategy', [None, 'simplecache'])
+@pytest.mark.parametrize('extensions', [['shp', 'shx', 'dbf', 'prj'], ['shp']])
+def test_shapefile_sidecars_fetched_once(
+    counting_http_server, tmp_path, strategy, extensions
+):
+    """The .shp and its sidecars are each downloaded once, whether they are
+    all listed in urlpath or found next to the .shp."""
+    base, counts = counting_http_server
+    prefix = f'{strategy}::' if strategy else ''
+    urlpath = [f'{prefix}{base}/stations.{ext}' for ext in extensions]
+    storage_options = {}
+    if strategy:
+        storage_options = {
+            strategy: {'same_names': True, 'cache_storage': str(tmp_path)}
+        }
+    item = ShapefileSource(
+        urlpath, use_fsspec=True, storage_options=storage_options
+    )
+    gdf = item.read()
+    assert len(gdf) == 86
+    for ext in ['shp', 'shx', 'dbf', 'prj']:
+        assert counts[f'/stations.{ext}'] == 1, counts
+    item.close()
@@ -4,12 +4,20 @@ Modified from those in the GeoPandas test suite.
 
 In order to run, SpatiaLite must be installed and configured.
 """
+import os
+import sqlite3
+
 import pytest
 
 import geopandas
+import pandas
+import shapely
 from geopandas import read_file
+from geopandas.testing import assert_geodataframe_equal
 
-from intake_geopandas import SpatiaLiteSource
+import intake_geopandas.geopandas as geopandas_module
+from intake_geopandas import PostGISSource, SpatiaLiteSource
+from intake_geopandas.geopandas import _RESULTS
 
 
 
@@ -20,6 +28,552 @@ def df_nybb():
     return df
 
 
+@pytest.fixture
+def postgis_uri():
+    """A PostGIS database from the standard PG* environment variables."""
+    sqlalchemy = pytest.importorskip('sqlalchemy')
+    uri = 'postgresql://{}:{}@{}:{}/{}'.format(
+        os.environ.get('PGUSER', 'postgres'), os.environ.get('PGPASSWORD', ''),
+        os.environ.get('PGHOST', 'localhost'), os.environ.get('PGPORT', 5432),
+        os.environ.get('PGDATABASE', 'test_geopandas'))
+    try:
+        engine = sqlalchemy.create_engine(uri)
+        with engine.connect() as con:
+            con.execute(sqlalchemy.text('SELECT PostGIS_Version()'))
+    except Exception:
+        raise pytest.skip('PostGIS is not available')
+    yield uri
+    engine.dispose()
+
+
+@pytest.fixture
+def spatialite_points():
+    """A SpatiaLite table of points with a spatial index."""
+    try:
+        con = sqlite3.connect(':memory:')
+        con.enable_load_extension(True)
+        con.load_extension('mod_spatialite')
+    except Exception:
+        raise pytest.skip('SpatiaLite is not available')
+    con.execute('SELECT InitSpatialMetadata(1)')
+    con.execute('CREATE TABLE points (id INTEGER PRIMARY KEY, name TEXT)')
+    con.execute("SELECT AddGeometryColumn('points', 'geom', 4326, 'POINT')")
+    con.execute("SELECT CreateSpatialIndex('points', 'geom')")
+    con.executemany(
+        'INSERT INTO points VALUES (?, ?, MakePoint(?, ?, 4326))',
+        [(i, f'p{i}', i, -i) for i in range(100)])
+    con.commit()
+    yield con
+    con.close()
+
+
+@pytest.fixture
+def sqlite_points():
+    """A plain SQLite table of points stored as WKB, without SpatiaLite."""
+    con = sqlite3.connect(':memory:', check_same_thread=False)
+    con.execute('CREATE TABLE points (id INTEGER, name TEXT, geom BLOB)')
+    con.executemany(
+        'INSERT INTO points VALUES (?, ?, ?)',
+        [(i, f'p{i}', shapely.Point(i, -i).wkb) for i in range(100)])
+    con.commit()
+    yield con
+    con.close()
+
+
+def test_read_sqlite_wkb(sqlite_points):
+    df = SpatiaLiteSource(sqlite_points, table='points').read()
+    assert isinstance(df, geopandas.GeoDataFrame)
+    assert len(df) == 100
+    assert df.geometry.iloc[3] == shapely.Point(3, -3)
+
+
+def test_ignore_geometry(sqlite_points):
+    datasource = SpatiaLiteSource(
+        sqlite_points, table='points', ignore_geometry=True)
+    df = datasource.read()
+    assert not isinstance(df, geopandas.GeoDataFrame)
+    assert list(df.columns) == ['id', 'name']
+    assert list(datasource.discover()['dtype']) == ['id', 'name']
+
+
+def test_ignore_geometry_not_fetched(sqlite_points):
+    statements = []
+    sqlite_points.set_trace_callback(statements.append)
+    datasource = SpatiaLiteSource(
+        sqlite_points, table='points', ignore_geometry=True, index='id',
+        npartitions=2)
+    df = datasource.read()
+    assert list(df.columns) == ['id', 'name']
+    assert list(datasource.to_dask().compute().columns) == ['id', 'name']
+    assert list(pandas.concat(datasource.iter_chunks(30)).columns) == ['id', 'name']
+    sqlite_points.set_trace_callback(None)
+    fetches = [s for s in statements if 'LIMIT' not in s and 'MIN(' not in s]
+    assert len(fetches) >= 4, statements
+    assert all(s.startswith('SELECT "id", "name" FROM') for s in fetches)
+
+
+def test_bounds(sqlite_points):
+    datasource = SpatiaLiteSource(
+        sqlite_points, table='points', geometry='bounds')
+    df = datasource.read()
+    assert not isinstance(df, geopandas.GeoDataFrame)
+    assert list(df.columns) == ['id', 'name', 'minx', 'miny', 'maxx', 'maxy']
+    assert df.loc[3, ['minx', 'miny', 'maxx', 'maxy']].tolist() == [3, -3, 3, -3]
+
+
+def test_bounds_sql_expressions(sqlite_points):
+    # Stand-ins for the PostGIS functions, to check the generated query
+    for i, name in enumerate(['ST_XMin', 'ST_YMin', 'ST_XMax', 'ST_YMax']):
+        sqlite_points.create_function(
+            name, 1, lambda wkb, i=i: shapely.from_wkb(wkb).bounds[i])
+    df = PostGISSource(
+        sqlite_points, sql_expr='SELECT * FROM points WHERE id < 10',
+        geometry='bounds').read()
+    assert list(df.columns) == ['id', 'name', 'minx', 'miny', 'maxx', 'maxy']
+    assert len(df) == 10
+    assert df['maxy'].dtype == 'float64'
+    assert df.loc[3, ['minx', 'miny', 'maxx', 'maxy']].tolist() == [3, -3, 3, -3]
+
+
+def test_iter_chunks(sqlite_points, tmp_path):
+    chunks = list(SpatiaLiteSource(sqlite_points, table='points').iter_chunks(30))
+    assert [len(chunk) for chunk in chunks] == [30, 30, 30, 10]
+    assert all(isinstance(chunk, geopandas.GeoDataFrame) for chunk in chunks)
+
+    # With a URI, chunks are streamed from a connection of the source's own
+    path = tmp_path / 'points.db'
+    sqlite_points.backup(sqlite3.connect(path))
+    datasource = SpatiaLiteSource(
+        f'sqlite:///{path}', table='points', geometry='bounds')
+    chunks = list(datasource.iter_chunks(chunksize=40))
+    assert [len(chunk) for chunk in chunks] == [40, 40, 20]
+    assert chunks[1]['minx'].tolist() == list(range(40, 80))
+
+    datasource = SpatiaLiteSource(
+        f'sqlite:///{path}', table='points', fetch_size=7,
+        geopandas_kwargs={'crs': 'EPSG:4326'})
+    chunks = list(datasource.iter_chunks(chunksize=40))
+    assert [len(chunk) for chunk in chunks] == [40, 40, 20]
+    assert all(chunk.crs == 'EPSG:4326' for chunk in chunks)
+    assert chunks[1].geometry.iloc[0] == shapely.Point(40, -40)
+
+
+@pytest.mark.parametrize('kwargs, n', [
+    (dict(npartitions=4), 4),
+    (dict(boundaries=[10, 50]), 3),
+    (dict(npartitions=1), 1),
+])
+def test_partitions(sqlite_points, kwargs, n):
+    sqlite_points.execute('INSERT INTO points VALUES (NULL, NULL, NULL)')
+    datasource = SpatiaLiteSource(
+        sqlite_points, table='points', index='id', **kwargs)
+    assert datasource.discover()['npartitions'] == n
+    parts = [datasource.read_partition(i) for i in range(n)]
+    assert all(isinstance(part, geopandas.GeoDataFrame) for part in parts)
+    assert sum(len(part) for part in parts) == 101
+    if 'boundaries' in kwargs:
+        assert parts[1]['id'].min() == 10
+        assert parts[1]['id'].max() == 49
+    ddf = datasource.to_dask()
+    assert ddf.npartitions == n
+    assert sorted(ddf.compute()['id'].dropna()) == list(range(100))
+
+
+def test_to_dask_lazy(sqlite_points, monkeypatch):
+    read = []
+    read_partition = geopandas_module._read_sql_partition
+    monkeypatch.setattr(
+        geopandas_module, '_read_sql_partition',
+        lambda uri, engine_kwargs, sql, options: read.append(sql)
+        or read_partition(uri, engine_kwargs, sql, options))
+    datasource = SpatiaLiteSource(
+        sqlite_points, table='points', index='id', npartitions=4,
+        geopandas_kwargs={'crs': 'EPSG:4326'})
+    ddf = datasource.to_dask()
+    assert read == []
+    assert ddf.crs == 'EPSG:4326'
+    assert list(ddf.columns) == ['id', 'name', 'geom']
+    assert ddf['id'].dtype == 'int64'
+    assert len(ddf.compute()) == 100
+    assert len(read) == 4
+    assert all('"id" <' in sql or '"id" >=' in sql for sql in read)
+
+
+def test_to_dask_tasks_without_source(tmp_path, monkeypatch):
+    import pickle
+
+    path = tmp_path / 'points.sqlite'
+    con = sqlite3.connect(path)
+    con.execute('CREATE TABLE points (id INTEGER, name TEXT, geom BLOB)')
+    con.executemany(
+        'INSERT INTO points VALUES (?, ?, ?)',
+        [(i, f'p{i}', shapely.Point(i, -i).wkb) for i in range(100)])
+    con.commit()
+    con.close()
+    datasource = SpatiaLiteSource(
+        f'sqlite:///{path}', table='points', index='id', npartitions=4)
+    ddf = datasource.to_dask()
+
+    # Unpickling a source re-runs __init__, the tasks must not carry one
+    def fail(self, *args, **kwargs):
+        raise AssertionError('source rebuilt in a task')
+
+    monkeypatch.setattr(SpatiaLiteSource, '__init__', fail)
+    monkeypatch.setattr(SpatiaLiteSource, '_auto_boundaries', fail)
+    df = pickle.loads(pickle.dumps(ddf)).compute()
+    assert sorted(df['id']) == list(range(100))
+    assert df.crs is None
+    datasource.close()
+
+
+def test_partitions_need_index(sqlite_points):
+    with pytest.raises(ValueError, match='index'):
+        SpatiaLiteSource(sqlite_points, table='points', npartitions=4)
+
+
+def test_tile_conditions(monkeypatch):
+    monkeypatch.setattr(PostGISSource, '_get_srid', lambda self: 4326)
+    datasource = PostGISSource(
+        'postgresql://', table='points', tiles=(3, 2), extent=(0, 0, 30, 20))
+    conditions = datasource._get_partitions()
+    assert len(conditions) == 6
+    assert 'ST_XMin("geom") >= 10.0' in conditions[1]
+    assert 'ST_XMin("geom") < 20.0' in conditions[1]
+    assert 'ST_YMin("geom") < 10.0' in conditions[1]
+    assert 'ST_YMin("geom") >=' not in conditions[1]
+    assert conditions[-1].endswith('OR "geom" IS NULL OR ST_IsEmpty("geom")')
+    assert 'IS NULL' not in conditions[-2]
+    with pytest.raises(ValueError, match='tiles'):
+        PostGISSource('postgresql://', table='points', tiles=2, index='id')
+
+
+def test_tile_extent_of_query(monkeypatch):
+    queries = []
+
+    def read_sql(self, sql, con, chunksize=None):
+        queries.append(sql)
+        return pandas.DataFrame([[0.0, 0.0, 30.0, 20.0]])
+
+    monkeypatch.setattr(PostGISSource, '_read_sql', read_sql)
+    monkeypatch.setattr(PostGISSource, '_get_con', lambda self: None)
+    datasource = PostGISSource(
+        'postgresql://', table='points', sql_expr='SELECT * FROM points WHERE id > 5',
+        tiles=2)
+    assert datasource._get_extent() == (0.0, 0.0, 30.0, 20.0)
+    # The table is ignored for a query
+    assert len(queries) == 1
+    assert 'ST_EstimatedExtent' not in queries[0]
+    assert 'id > 5' in queries[0]
+
+
+def test_tiles(postgis_uri):
+    gdf = geopandas.GeoDataFrame(
+        {'id': range(100)},
+        geometry=[shapely.box(i, i % 10, i + 15, i % 10 + 1) for i in range(98)]
+        + [None, shapely.Polygon()],
+        crs='EPSG:4326')
+    gdf.rename_geometry('geom').to_postgis('tiles', postgis_uri, if_exists='replace')
+    datasource = PostGISSource(postgis_uri, table='tiles', tiles=3)
+    assert datasource.discover()['npartitions'] == 9
+    assert datasource.to_dask().spatial_partitions is None
+    datasource = PostGISSource(
+        postgis_uri, table='tiles', tiles=3, spatial_partitions=True)
+    ddf = datasource.to_dask()
+    assert ddf.npartitions == 9
+    # Including the NULL and empty geometries, which have no bounding box
+    assert sorted(ddf.compute()['id']) == list(range(100))
+    for i, extent in enumerate(ddf.spatial_partitions):
+        part = datasource.read_partition(i)
+        if len(part):
+            assert extent.covers(shapely.box(*part.total_bounds))
+
+
+def test_bbox_spatial_index(spatialite_points):
+    datasource = SpatiaLiteSource(
+        spatialite_points, table='points', bbox=(10, -20, 19.5, 0))
+    assert 'SpatialIndex' in datasource._get_base_sql()
+    df = datasource.read()
+    assert df['id'].tolist() == list(range(10, 20))
+    assert df.crs == 'EPSG:4326'
+    assert df.geometry.iloc[0] == shapely.Point(10, -10)
+
+
+def test_bbox_crs(spatialite_points):
+    bbox = geopandas.GeoSeries(
+        [shapely.box(10, -20, 19.5, 0)], crs='EPSG:4326').to_crs(3857)
+    df = SpatiaLiteSource(spatialite_points, table='points', bbox=bbox).read()
+    assert df['id'].tolist() == list(range(10, 20))
+    assert isinstance(df, geopandas.GeoDataFrame)
+
+
+def test_bbox_needs_table(sqlite_points):
+    with pytest.raises(ValueError, match='table'):
+        SpatiaLiteSource(
+            sqlite_points, sql_expr='SELECT * FROM points', bbox=(0, 0, 1, 1))
+
+
+def test_bbox_postgis(postgis_uri):
+    gdf = geopandas.GeoDataFrame(
+        {'id': range(100)},
+        geometry=[shapely.Point(i, -i) for i in range(100)], crs='EPSG:4326')
+    gdf.rename_geometry('geom').to_postgis('bbox', postgis_uri, if_exists='replace')
+    df = PostGISSource(postgis_uri, table='bbox', bbox=(10, -20, 19.5, 0)).read()
+    assert sorted(df['id']) == list(range(10, 20))
+
+
+def test_discover_without_reading(sqlite_points, tmp_path, monkeypatch):
+    path = tmp_path / 'points.db'
+    sqlite_points.backup(sqlite3.connect(path))
+
+    def fail(*args, **kwargs):
+        raise AssertionError('discover() must not read the data')
+
+    monkeypatch.setattr(geopandas, 'read_postgis', fail)
+    datasource = SpatiaLiteSource(sqlite_points, table='points')
+    info = datasource.discover()
+    assert info['dtype'] == {'id': 'int64', 'name': 'object', 'geom': 'geometry'}
+    assert info['shape'] == (None, 3)
+    assert info['metadata']['geometry'] == 'geom'
+    monkeypatch.undo()
+    assert dict(datasource.read().dtypes) == info['dtype']
+
+    # A trailing semicolon is dropped from the query, which is wrapped
+    datasource = SpatiaLiteSource(
+        sqlite_points, sql_expr='SELECT id, geom FROM points WHERE id < 5;\n')
+    assert datasource.discover()['dtype'] == {'id': 'int64', 'geom': 'geometry'}
+    assert datasource.read()['id'].tolist() == list(range(5))
+
+    # With a URI, the column types come from the table catalog
+    info = SpatiaLiteSource(
+        f'sqlite:///{path}', table='points', count_rows=True).discover()
+    assert info['dtype'] == {'id': 'int64', 'name': 'object', 'geom': 'geometry'}
+    assert info['shape'] == (100, 3)
+    info = SpatiaLiteSource(
+        f'sqlite:///{path}', table='points', geometry='bounds').discover()
+    assert list(info['dtype']) == ['id', 'name', 'minx', 'miny', 'maxx', 'maxy']
+
+
+def test_shared_engine(sqlite_points, tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    path = tmp_path / 'points.db'
+    sqlite_points.backup(sqlite3.connect(path))
+    uri = f'sqlite:///{path}'
+    a = SpatiaLiteSource(uri, table='points', index='id', npartitions=4)
+    b = SpatiaLiteSource(uri, sql_expr='SELECT * FROM points WHERE id < 10')
+    c = SpatiaLiteSource(uri, table='points', pool_size=2)
+    assert a._get_con() is b._get_con()
+    assert c._get_con() is not a._get_con()
+    engine = a._get_con()
+
+    with ThreadPoolExecutor(4) as pool:
+        parts = list(pool.map(a.read_partition, range(4)))
+    assert sum(len(part) for part in parts) == 100
+    assert len(b.read()) == 10
+
+    a.close()
+    assert b._get_con() is engine
+    b.close()
+    # A new engine once the last user of the previous one is closed
+    assert SpatiaLiteSource(uri, table='points')._get_con() is not engine
+
+
+def test_result_cache(sqlite_points, tmp_path):
+    import sqlalchemy
+
+    path = tmp_path / 'points.db'
+    sqlite_points.backup(sqlite3.connect(path))
+    uri = f'sqlite:///{path}'
+    cache_dir = str(tmp_path / 'cache')
+    source = SpatiaLiteSource(
+        uri, sql_expr='SELECT * FROM points WHERE id < 10', cache=True,
+        cache_dir=cache_dir)
+    source.invalidate()
+    queries = []
+
+    def count(con, cursor, statement, *args):
+        queries.append(statement)
+
+    engine = source._get_con()
+    sqlalchemy.event.listen(engine, 'before_cursor_execute', count)
+    info = source.cache_info()
+    expected = source.read()
+    assert queries
+    assert source.cache_info()['misses'] == info['misses'] + 1
+
+    # Another source for the same, differently formatted, query
+    queries.clear()
+    hits = source.cache_info()['hits']
+    same = SpatiaLiteSource(
+        uri, sql_expr=' SELECT *\n  FROM points WHERE id < 10;', cache=True)
+    info = same.discover()
+    assert info['shape'] == (10, 3)
+    assert info['dtype'] == {'id': 'int64', 'name': 'object', 'geom': 'geometry'}
+    df = same.read()
+    assert_geodataframe_equal(df, expected)
+    assert df is not expected
+    assert queries == []
+    assert same.cache_info()['hits'] == hits + 1
+
+    # After a restart, from the GeoParquet file
+    _RESULTS.clear()
+    restarted = SpatiaLiteSource(
+        uri, sql_expr='SELECT * FROM points WHERE id < 10', cache=True,
+        cache_dir=cache_dir)
+    assert_geodataframe_equal(restarted.read(), expected)
+    assert queries == []
+
+    restarted.invalidate()
+    assert not os.listdir(cache_dir)
+    misses = restarted.cache_info()['misses']
+    assert_geodataframe_equal(restarted.read(), expected)
+    assert queries
+    assert restarted.cache_info()['misses'] == misses + 1
+    sqlalchemy.event.remove(engine, 'before_cursor_execute', count)
+
+
+def test_result_cache_eviction(sqlite_points, tmp_path, monkeypatch):
+    path = tmp_path / 'points.db'
+    sqlite_points.backup(sqlite3.connect(path))
+    uri = f'sqlite:///{path}'
+    sources = [
+        SpatiaLiteSource(
+            uri, sql_expr=f'SELECT * FROM points WHERE id < {n}', cache=True,
+            cache_ttl=60, cache_max_bytes=2000)
+        for n in (10, 20, 90)
+    ]
+    for source in sources:
+        source.invalidate()
+        source.read()
+    assert sources[0]._cache_key() not in _RESULTS
+    assert sources[1]._cache_key() in _RESULTS
+    # Too large to be cached
+    assert sources[2]._cache_key() not in _RESULTS
+
+    # Expired
+    monkeypatch.setattr('time.time', lambda: 1e12)
+    info = sources[1].cache_info()
+    SpatiaLiteSource(
+        uri, sql_expr='SELECT * FROM points WHERE id < 20', cache=True,
+        cache_ttl=60).read()
+    assert sources[1].cache_info()['misses'] == info['misses'] + 1
+
+
+def test_watermark(sqlite_points, tmp_path):
+    state_path = str(tmp_path / 'state.parquet')
+    datasource = SpatiaLiteSource(
+        sqlite_points, table='points', watermark_column='id', state_path=state_path)
+    assert len(datasource.read()) == 100
+    assert len(datasource.refresh()) == 0
+
+    sqlite_points.executemany(
+        'INSERT INTO points VALUES (?, ?, ?)',
+        [(i, f'p{i}', shapely.Point(i, -i).wkb) for i in range(100, 110)])
+    new = datasource.refresh()
+    assert new['id'].tolist() == list(range(100, 110))
+    df = datasource.read()
+    assert df['id'].tolist() == list(range(110))
+    assert df.index.tolist() == list(range(110))
+
+    # A new source starts from the saved state, and only fetches the new rows
+    sqlite_points.execute(
+        'INSERT INTO points VALUES (?, ?, ?)', (110, 'p110', shapely.Point(0, 0).wkb))
+    sqlite_points.execute('DELETE FROM points WHERE id < 100')
+    datasource = SpatiaLiteSource(
+        sqlite_points, table='points', watermark_column='id', state_path=state_path)
+    df = datasource.read()
+    assert isinstance(df, geopandas.GeoDataFrame)
+    assert df['id'].tolist() == list(range(111))
+    assert_geodataframe_equal(geopandas.read_parquet(state_path), df)
+
+    # Refreshing a new source first keeps the saved rows too
+    sqlite_points.execute(
+        'INSERT INTO points VALUES (?, ?, ?)', (111, 'p111', shapely.Point(0, 0).wkb))
+    datasource = SpatiaLiteSource(
+        sqlite_points, table='points', watermark_column='id', state_path=state_path)
+    assert datasource.refresh()['id'].tolist() == [111]
+    assert datasource.read()['id'].tolist() == list(range(112))
+    assert len(geopandas.read_parquet(state_path)) == 112
+
+
+def test_watermark_needed():
+    with pytest.raises(ValueError, match='watermark'):
+        SpatiaLiteSource('sqlite://', table='points', state_path='state.parquet')
+    with pytest.raises(ValueError, match='watermark'):
+        SpatiaLiteSource('sqlite://', table='points').refresh()
+
+
+def test_result_cache_schema(sqlite_points, tmp_path):
+    path = tmp_path / 'points.db'
+    sqlite_points.backup(sqlite3.connect(path))
+    uri = f'sqlite:///{path}'
+    sql_expr = 'SELECT * FROM points WHERE id < 3'
+    first = SpatiaLiteSource(uri, sql_expr=sql_expr, cache=True)
+    first.invalidate()
+    first.read()
+    # Integer boundaries between 0 and 2 give 3 partitions, not 8
+    datasource = SpatiaLiteSource(
+        uri, sql_expr=sql_expr, cache=True, index='id', npartitions=8)
+    assert datasource.discover()['npartitions'] == 3
+    assert len(datasource.read_partition(2)) == 1
+
+
+def test_result_cache_geometry_size():
+    from intake_geopandas.geopandas import _cache_put
+
+    gdf = geopandas.GeoDataFrame(
+        geometry=[shapely.Point(0, 0).buffer(1, 250)] * 100)
+    _RESULTS.pop('sizes', None)
+    _cache_put('sizes', gdf, 0, None)
+    # 1001 coordinates of 16 bytes per polygon
+    assert _RESULTS.pop('sizes')[1] > 100 * 1001 * 16
+
+
+@pytest.mark.parametrize('encode', [
+    lambda g: shapely.to_wkb(g, include_srid=True),
+    lambda g: shapely.to_wkb(g, hex=True, include_srid=True),
+], ids=['ewkb', 'hex'])
+def test_decode_ewkb(encode):
+    points = shapely.set_srid(shapely.points([[0, 1], [2, 3]]), 4326)
+    con = sqlite3.connect(':memory:')
+    con.execute('CREATE TABLE points (id INTEGER, geom BLOB)')
+    con.executemany('INSERT INTO points VALUES (?, ?)', [
+        (0, encode(points[0])), (1, None), (2, encode(points[1]))])
+    df = SpatiaLiteSource(con, table='points').read()
+    assert df.crs == 'EPSG:4326'
+    assert df.geometry.isna().tolist() == [False, True, False]
+    assert df.geometry.iloc[2] == shapely.Point(2, 3)
+
+
+def test_arrow_table_conversion(monkeypatch):
+    import pyarrow
+
+    points = shapely.set_srid(shapely.points([[0, 1], [1, 2], [2, 3]]), 4326)
+    table = pyarrow.table({
+        'id': [0, 1, 2],
+        'geom': pyarrow.array(
+            shapely.to_wkb(points, include_srid=True), pyarrow.binary()),
+    })
+    monkeypatch.setattr(PostGISSource, '_read_arrow', lambda self, sql: table)
+    datasource = PostGISSource('postgresql://', table='points', use_arrow=True)
+    df = datasource._read(None)
+    assert isinstance(df, geopandas.GeoDataFrame)
+    assert df.crs == 'EPSG:4326'
+    assert df['id'].tolist() == [0, 1, 2]
+    assert df.geometry.iloc[2] == shapely.Point(2, 3)
+
+
+def test_arrow_postgis(postgis_uri):
+    pytest.importorskip('adbc_driver_postgresql')
+    gdf = geopandas.GeoDataFrame(
+        {'id': range(100)},
+        geometry=[shapely.Point(i, -i) for i in range(100)], crs='EPSG:4326')
+    gdf.rename_geometry('geom').to_postgis('arrow', postgis_uri, if_exists='replace')
+    df = PostGISSource(postgis_uri, table='arrow', use_arrow=True).read()
+    assert df.crs == 'EPSG:4326'
+    assert df.sort_values('id').geometry.tolist() == gdf.geometry.tolist()
+
+
 def test_read_spatialite_null_geom(df_nybb):
     """Tests that geometry with NULL is accepted."""
     try: